@@ -5,6 +5,17 @@ from django.core.management.base import BaseCommand, CommandError
 
 from address.models import Address
 
+# Export key -> legacy Address column.
+EXPORT_FIELDS = {
+    "line1": "address1",
+    "line2": "address2",
+    "city": "locality",
+    "state": "state",
+    "postal_code": "postal_code",
+    "country": "country",
+    "raw": "raw",
+}
+
 
 class Command(BaseCommand):
     help = "Export legacy addresses to JSON or JSONL for ingestion."
@@ -22,32 +33,25 @@ class Command(BaseCommand):
         output_path = Path(options["output"])
         fmt = options["format"]
 
-        payload = [
-            {
-                "line1": address.address1,
-                "line2": address.address2,
-                "city": address.locality,
-                "state": address.state,
-                "postal_code": address.postal_code,
-                "country": address.country,
-                "raw": address.raw,
-            }
-            for address in Address.objects.all().order_by("id")
-        ]
-
-        if not payload:
+        rows = Address.objects.order_by("id").values_list(*EXPORT_FIELDS.values())
+        if not rows.exists():
             raise CommandError("No legacy addresses to export")
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Stream plain tuples from a server-side cursor instead of model instances.
+        entries = (dict(zip(EXPORT_FIELDS, row)) for row in rows.iterator(chunk_size=2000))
+        exported = 0
+
         if fmt == "jsonl":
             with output_path.open("w", encoding="utf-8") as handle:
-                for entry in payload:
+                for entry in entries:
                     handle.write(json.dumps(entry) + "\n")
+                    exported += 1
         else:
+            payload = list(entries)
+            exported = len(payload)
             with output_path.open("w", encoding="utf-8") as handle:
                 json.dump(payload, handle, indent=2)
 
-        self.stdout.write(
-            self.style.SUCCESS(f"Exported {len(payload)} address(es) to {output_path}")
-        )
+        self.stdout.write(self.style.SUCCESS(f"Exported {exported} address(es) to {output_path}"))
@@ -2,6 +2,7 @@ import random
 from typing import Sequence
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from address.models import Address
 
@@ -44,6 +45,8 @@ SAMPLE_ADDRESSES: Sequence[dict] = (
     },
 )
 
+LEGACY_FIELDS = ("raw", "address1", "address2", "locality", "state", "postal_code", "country")
+
 
 class Command(BaseCommand):
     help = "Populate the legacy address table with sample data for ingestion testing."
@@ -59,6 +62,7 @@ class Command(BaseCommand):
             help="Fraction of rows that reuse existing sample addresses",
         )
 
+    @transaction.atomic
     def handle(self, *args, **options):
         count = options["count"]
         duplicate_ratio = max(0.0, min(1.0, options["duplicate_ratio"]))
@@ -66,21 +70,15 @@ class Command(BaseCommand):
         created = 0
         duplicates = 0
 
+        # Sample duplicates from memory rather than an ORDER BY RANDOM() query per row.
+        pool = list(Address.objects.values_list(*LEGACY_FIELDS))
+        rows = []
+
         for idx in range(count):
-            if random.random() < duplicate_ratio and Address.objects.exists():
-                sample = Address.objects.order_by("?").first()
-                if sample:
-                    Address.objects.create(
-                        raw=sample.raw,
-                        address1=sample.address1,
-                        address2=sample.address2,
-                        locality=sample.locality,
-                        state=sample.state,
-                        postal_code=sample.postal_code,
-                        country=sample.country,
-                    )
-                    duplicates += 1
-                    continue
+            if pool and random.random() < duplicate_ratio:
+                rows.append(random.choice(pool))
+                duplicates += 1
+                continue
 
             record = dict(random.choice(SAMPLE_ADDRESSES))
             raw = ", ".join(
@@ -95,16 +93,23 @@ class Command(BaseCommand):
                     ],
                 )
             )
-            Address.objects.create(
-                raw=raw,
-                address1=record["line1"],
-                locality=record["city"],
-                state=record["state"],
-                postal_code=record["postal_code"],
-                country=record["country"],
+            row = (
+                raw,
+                record["line1"],
+                "",
+                record["city"],
+                record["state"],
+                record["postal_code"],
+                record["country"],
             )
+            pool.append(row)
+            rows.append(row)
             created += 1
 
+        Address.objects.bulk_create(
+            [Address(**dict(zip(LEGACY_FIELDS, row))) for row in rows], batch_size=500
+        )
+
         self.stdout.write(
             self.style.SUCCESS(f"Created {created} new legacy addresses ({duplicates} duplicates).")
         )
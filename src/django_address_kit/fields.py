@@ -19,7 +19,8 @@ class AddressField(models.ForeignKey):
             address = AddressField(blank=True, null=True)
 
     This field is a ForeignKey to the Address model with special handling
-    to make it easier to use addresses in models.
+    to make it easier to use addresses in models. ``on_delete`` defaults to
+    ``models.PROTECT`` so referenced addresses cannot be deleted by accident.
     """
 
     description = "An address field"
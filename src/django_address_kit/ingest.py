@@ -2,17 +2,34 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Mapping, MutableMapping, Optional
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Mapping, MutableMapping, Optional
 
+from .providers.base import GeocodeError, geocode_many
 from .providers.google import GoogleMapsAdapter
-from .resolvers import create_address_from_components, create_address_from_raw
-from .utils import normalize_string
+from .resolvers import (
+    create_address_from_components,
+    create_address_from_raw,
+    create_addresses_from_components,
+)
+from .utils import normalize_string, standardize_address
 
 if TYPE_CHECKING:  # pragma: no cover
     from .models import Address
 
 LegacyMapping = Mapping[str, object]
 
+# Legacy field names probed, in priority order, for each normalized component.
+_LINE1_KEYS = ("line1", "street", "street_line_1", "street1", "address1")
+_LINE2_KEYS = ("line2", "street_line_2", "street2", "address2")
+_CITY_KEYS = ("city", "locality")
+_STATE_KEYS = ("state", "state_name")
+_STATE_CODE_KEYS = ("state_code", "province", "state_iso")
+_POSTAL_CODE_KEYS = ("postal_code", "zip", "zipcode")
+_COUNTRY_KEYS = ("country", "country_name")
+_COUNTRY_CODE_KEYS = ("country_code", "country_iso")
+_UNIT_KEYS = ("unit", "suite", "apartment", "apt", "unit_number")
+
 
 def ingest_legacy_address(
     legacy_payload: LegacyMapping,
@@ -20,6 +37,9 @@ def ingest_legacy_address(
     geocode_missing: bool = True,
     geocode_adapter=None,
     google_api_key: Optional[str] = None,
+    locality_cache: Optional[dict] = None,
+    address_cache: Optional[dict] = None,
+    geocode_results: Optional[Mapping[str, dict]] = None,
 ) -> "Address":
     """Import a legacy django-address style payload into the new models.
 
@@ -28,11 +48,159 @@ def ingest_legacy_address(
         geocode_missing: Whether to geocode when structured fields are incomplete.
         geocode_adapter: Optional adapter implementing the Google geocode interface.
         google_api_key: API key used to instantiate GoogleMapsAdapter when needed.
+        locality_cache: Optional caller-owned dict memoizing resolved localities.
+        address_cache: Optional caller-owned dict mapping (raw, country) to the
+            address a geocoded payload produced; repeats skip the geocode call.
+        geocode_results: Optional mapping of standardized query to a geocode result,
+            or the `GeocodeError` it raised, fetched earlier (see
+            `ingest_legacy_addresses`); hits skip the adapter.
 
     Returns:
         Address: Persisted address instance with normalized data.
     """
 
+    raw, address_data, location_data, structured = _legacy_components(legacy_payload)
+
+    if structured:
+        return create_address_from_components(
+            address_data=address_data,
+            location_data=location_data,
+            raw=raw,
+            locality_cache=locality_cache,
+        )
+
+    if not geocode_missing:
+        return create_address_from_raw(raw, locality_cache=locality_cache)
+
+    cache_key = _address_cache_key(raw, location_data)
+    if address_cache is not None and cache_key in address_cache:
+        return address_cache[cache_key]
+
+    adapter = geocode_adapter or (
+        GoogleMapsAdapter(api_key=google_api_key) if google_api_key else None
+    )
+    if adapter and geocode_results:
+        adapter = _PrefetchedGeocodeAdapter(adapter, geocode_results)
+    address = create_address_from_raw(raw, geocode_adapter=adapter, locality_cache=locality_cache)
+    if address_cache is not None:
+        address_cache[cache_key] = address
+    return address
+
+
+def ingest_legacy_addresses(
+    legacy_payloads: Iterable[LegacyMapping],
+    *,
+    chunk_size: int = 500,
+    geocode_missing: bool = True,
+    geocode_adapter=None,
+    google_api_key: Optional[str] = None,
+    geocode_workers: int = 8,
+    address_cache: Optional[dict] = None,
+    geocode_results: Optional[dict] = None,
+) -> list["Address"]:
+    """Import many legacy payloads, batching inserts for structured entries.
+
+    Payloads are consumed `chunk_size` at a time. Entries with complete street
+    and locality data are written through `create_addresses_from_components`.
+    The rest take the same raw/geocode path as `ingest_legacy_address`, with each
+    chunk's geocode queries issued up front across `geocode_workers` threads.
+    Resolved localities and geocoded addresses (`address_cache`, see
+    `ingest_legacy_address`) are reused across the whole run. When
+    `geocode_results` is given, the prefetched responses are also stored there
+    so a caller can replay rows without paying for the same lookups again.
+    Results follow input order.
+    """
+
+    adapter = geocode_adapter or (
+        GoogleMapsAdapter(api_key=google_api_key) if google_api_key else None
+    )
+    locality_cache: dict = {}
+    if address_cache is None:
+        address_cache = {}
+    addresses: list[Address] = []
+
+    payloads = iter(legacy_payloads)
+    while chunk := list(islice(payloads, chunk_size)):
+        results: list[Optional[Address]] = [None] * len(chunk)
+        structured_indexes: list[int] = []
+        structured_entries: list[tuple[dict, dict, str]] = []
+
+        unstructured: list[tuple[int, LegacyMapping, str, dict]] = []
+
+        for index, legacy_payload in enumerate(chunk):
+            raw, address_data, location_data, structured = _legacy_components(legacy_payload)
+            if structured:
+                structured_indexes.append(index)
+                structured_entries.append((address_data, location_data, raw))
+            else:
+                unstructured.append((index, legacy_payload, raw, location_data))
+
+        chunk_adapter = adapter
+        # Rows an earlier chunk already resolved are served from address_cache.
+        to_geocode = [
+            raw
+            for _, _, raw, location_data in unstructured
+            if _address_cache_key(raw, location_data) not in address_cache
+        ]
+        if geocode_missing and adapter and to_geocode:
+            prefetched = geocode_many(
+                adapter,
+                (standardize_address(raw) for raw in to_geocode),
+                max_workers=geocode_workers,
+            )
+            if geocode_results is not None:
+                geocode_results.update(prefetched)
+            chunk_adapter = _PrefetchedGeocodeAdapter(adapter, prefetched)
+
+        for index, legacy_payload, _, _ in unstructured:
+            results[index] = ingest_legacy_address(
+                legacy_payload,
+                geocode_missing=geocode_missing,
+                geocode_adapter=chunk_adapter,
+                locality_cache=locality_cache,
+                address_cache=address_cache,
+            )
+
+        created = create_addresses_from_components(
+            structured_entries, locality_cache=locality_cache, batch_size=chunk_size
+        )
+        for index, address in zip(structured_indexes, created):
+            results[index] = address
+        addresses.extend(results)
+
+    return addresses
+
+
+class _PrefetchedGeocodeAdapter:
+    """Serve geocode results fetched ahead of time, delegating misses to `adapter`.
+
+    Prefetched failures are stored as `GeocodeError` instances and re-raised, so a
+    permanently failing query is only sent to the provider once.
+    """
+
+    def __init__(self, adapter, results: Mapping[str, dict]) -> None:
+        self._adapter = adapter
+        self._results = results
+        self.provider_name = getattr(adapter, "provider_name", adapter.__class__.__name__.lower())
+
+    def geocode(self, query: str):
+        if query not in self._results:
+            return self._adapter.geocode(query)
+        result = self._results[query]
+        if isinstance(result, GeocodeError):
+            raise result
+        return result
+
+
+def _address_cache_key(raw: str, location_data: Mapping[str, str]) -> tuple[str, str]:
+    """Key geocoded addresses by raw text and country, as used by `address_cache`."""
+
+    return raw.casefold(), location_data["country_code"] or location_data["country"]
+
+
+def _legacy_components(legacy_payload: LegacyMapping) -> tuple[str, dict, dict, bool]:
+    """Return `(raw, address_data, location_data, structured)` for a legacy payload."""
+
     normalized = _normalize_legacy_payload(legacy_payload)
     raw = normalized["raw"]
 
@@ -65,20 +233,7 @@ def ingest_legacy_address(
         location_data["state_code"] or location_data["state"]
     )
 
-    if has_street and has_locality:
-        return create_address_from_components(
-            address_data=address_data,
-            location_data=location_data,
-            raw=raw,
-        )
-
-    if not geocode_missing:
-        return create_address_from_raw(raw)
-
-    adapter = geocode_adapter or (
-        GoogleMapsAdapter(api_key=google_api_key) if google_api_key else None
-    )
-    return create_address_from_raw(raw, geocode_adapter=adapter)
+    return raw, address_data, location_data, bool(has_street and has_locality)
 
 
 def _normalize_legacy_payload(payload: LegacyMapping) -> MutableMapping[str, str]:
@@ -87,19 +242,21 @@ def _normalize_legacy_payload(payload: LegacyMapping) -> MutableMapping[str, str
     data: MutableMapping[str, str] = {}
 
     # Extract common legacy field names.
-    line1 = _first_non_empty(payload, ["line1", "street", "street_line_1", "street1", "address1"])
-    line2 = _first_non_empty(payload, ["line2", "street_line_2", "street2", "address2"])
+    line1 = _first_non_empty(payload, _LINE1_KEYS)
+    line2 = _first_non_empty(payload, _LINE2_KEYS)
 
-    city = _first_non_empty(payload, ["city", "locality"])
-    state = _first_non_empty(payload, ["state", "state_name"])
-    state_code = _first_non_empty(payload, ["state_code", "province", "state_iso"])
-    postal_code = _first_non_empty(payload, ["postal_code", "zip", "zipcode"])
-    country = _first_non_empty(payload, ["country", "country_name"])
-    country_code = _first_non_empty(payload, ["country_code", "country_iso"])
+    city = _first_non_empty(payload, _CITY_KEYS)
+    state = _first_non_empty(payload, _STATE_KEYS)
+    state_code = _first_non_empty(payload, _STATE_CODE_KEYS)
+    postal_code = _first_non_empty(payload, _POSTAL_CODE_KEYS)
+    country = _first_non_empty(payload, _COUNTRY_KEYS)
+    country_code = _first_non_empty(payload, _COUNTRY_CODE_KEYS)
 
-    unit = _first_non_empty(payload, ["unit", "suite", "apartment", "apt", "unit_number"])
+    unit = _first_non_empty(payload, _UNIT_KEYS)
 
-    raw_input = payload.get("raw") if isinstance(payload.get("raw"), str) else ""
+    raw_input = payload.get("raw")
+    if not isinstance(raw_input, str):
+        raw_input = ""
     normalized_raw_input = normalize_string(raw_input) if raw_input else ""
 
     data["street_number"], data["route"] = _split_line(line1)
@@ -142,7 +299,7 @@ def _split_line(line: Optional[str]) -> tuple[str, str]:
     return "", " ".join(parts)
 
 
-def _first_non_empty(payload: LegacyMapping, keys: list[str]) -> str:
+def _first_non_empty(payload: LegacyMapping, keys: tuple[str, ...]) -> str:
     for key in keys:
         value = payload.get(key)
         if isinstance(value, str) and value.strip():
@@ -150,4 +307,4 @@ def _first_non_empty(payload: LegacyMapping, keys: list[str]) -> str:
     return ""
 
 
-__all__ = ["ingest_legacy_address"]
+__all__ = ["ingest_legacy_address", "ingest_legacy_addresses"]
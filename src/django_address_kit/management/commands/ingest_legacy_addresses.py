@@ -1,9 +1,12 @@
 import json
+from itertools import islice
 from pathlib import Path
 
 from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 
-from django_address_kit.ingest import ingest_legacy_address
+from django_address_kit.ingest import ingest_legacy_address, ingest_legacy_addresses
+from django_address_kit.providers import CachedGeocodeAdapter, GoogleMapsAdapter
 
 
 class Command(BaseCommand):
@@ -25,34 +28,74 @@ class Command(BaseCommand):
             help="Geocode entries that lack structured fields using Google Maps",
         )
         parser.add_argument("--google-api-key", help="Google Maps Geocoding API key")
+        parser.add_argument(
+            "--cache-geocodes",
+            action="store_true",
+            help="Cache Google Maps responses in the default Django cache between runs",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of records ingested per batch (default: 500)",
+        )
 
     def handle(self, *args, **options):
         input_path = Path(options["input"])
         if not input_path.exists():
             raise CommandError(f"Input file {input_path} does not exist")
 
-        entries = list(self._iter_entries(input_path, options["format"]))
-        if not entries:
-            self.stdout.write(self.style.WARNING("No records found; exiting."))
-            return
-
         geocode_missing = options["geocode_missing"]
         google_api_key = options.get("google_api_key")
+        chunk_size = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1")
 
+        geocode_adapter = None
+        if options["cache_geocodes"] and google_api_key:
+            geocode_adapter = CachedGeocodeAdapter(GoogleMapsAdapter(api_key=google_api_key))
+
+        seen = 0
         ingested = 0
-        failures: list[tuple[dict, str]] = []
+        failures: list[tuple[object, str]] = []
 
-        for entry in entries:
+        entries = self._iter_entries(input_path, options["format"], failures)
+        while chunk := list(islice(entries, chunk_size)):
+            seen += len(chunk)
+            # Shared with the replay below so failed chunks do not re-bill lookups.
+            geocode_results: dict = {}
             try:
-                ingest_legacy_address(
-                    entry,
-                    geocode_missing=geocode_missing,
-                    google_api_key=google_api_key,
-                )
-            except Exception as exc:  # pragma: no cover - defensive
-                failures.append((entry, str(exc)))
+                with transaction.atomic():
+                    ingest_legacy_addresses(
+                        chunk,
+                        chunk_size=chunk_size,
+                        geocode_missing=geocode_missing,
+                        geocode_adapter=geocode_adapter,
+                        google_api_key=google_api_key,
+                        geocode_results=geocode_results,
+                    )
+            except Exception:
+                # Replay the rolled-back chunk one record at a time to isolate failures;
+                # bad input can fail in many ways (validation, DataError, TypeError, ...).
+                for entry in chunk:
+                    try:
+                        ingest_legacy_address(
+                            entry,
+                            geocode_missing=geocode_missing,
+                            geocode_adapter=geocode_adapter,
+                            google_api_key=google_api_key,
+                            geocode_results=geocode_results,
+                        )
+                    except Exception as exc:
+                        failures.append((entry, str(exc)))
+                    else:
+                        ingested += 1
             else:
-                ingested += 1
+                ingested += len(chunk)
+
+        if not seen and not failures:
+            self.stdout.write(self.style.WARNING("No records found; exiting."))
+            return
 
         self.stdout.write(self.style.SUCCESS(f"Ingested {ingested} address(es)."))
 
@@ -61,17 +104,27 @@ class Command(BaseCommand):
                 self.stderr.write(f"Failed record: {json.dumps(record)}\n  Reason: {message}")
             raise CommandError(f"{len(failures)} record(s) failed to ingest")
 
-    def _iter_entries(self, path: Path, fmt: str):
+    def _iter_entries(self, path: Path, fmt: str, failures: list[tuple[object, str]]):
+        """Yield the input's JSON objects, recording any other entry as a failure."""
+
+        for entry in self._read_entries(path, fmt):
+            if isinstance(entry, dict):
+                yield entry
+            else:
+                failures.append((entry, "Record must be a JSON object"))
+
+    def _read_entries(self, path: Path, fmt: str):
         if fmt == "jsonl":
-            with path.open("r", encoding="utf-8") as handle:
+            # json.loads decodes UTF-8 bytes itself; skip the text-mode decode layer.
+            with path.open("rb") as handle:
                 for line in handle:
                     line = line.strip()
                     if not line:
                         continue
                     yield json.loads(line)
         else:
-            with path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
+            with path.open("rb") as handle:
+                payload = json.loads(handle.read())
             if isinstance(payload, list):
                 for entry in payload:
                     yield entry
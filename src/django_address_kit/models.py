@@ -100,6 +100,43 @@ class Locality(models.Model):
         return txt
 
 
+# Columns loaded by AddressQuerySet.lean(); ``locality`` keeps the FK id for joins.
+LEAN_FIELDS = (
+    "id",
+    "street_number",
+    "street_name",
+    "street_type",
+    "street_direction",
+    "unit_type",
+    "unit_number",
+    "locality",
+    "locality__name",
+    "locality__postal_code",
+    "locality__state__name",
+    "locality__state__code",
+    "locality__state__country__name",
+    "locality__state__country__code",
+)
+
+
+class AddressQuerySet(models.QuerySet):
+    """Query helpers that load an address's related rows up front."""
+
+    def with_geography(self) -> AddressQuerySet:
+        """Join locality/state/country and prefetch provider sources and identifiers."""
+        return self.select_related("locality__state__country").prefetch_related(
+            "sources", "identifiers"
+        )
+
+    def lean(self) -> AddressQuerySet:
+        """Load only the display columns of the address and its geography.
+
+        Reading any other column (``raw``, ``formatted``, coordinates) costs one
+        extra query per instance, so use this for list views only.
+        """
+        return self.select_related("locality__state__country").only(*LEAN_FIELDS)
+
+
 class Address(models.Model):
     """
     Represents a complete address with optional geocoding.
@@ -135,6 +172,8 @@ class Address(models.Model):
     latitude = models.FloatField(blank=True, null=True)
     longitude = models.FloatField(blank=True, null=True)
 
+    objects = AddressQuerySet.as_manager()
+
     class Meta:
         verbose_name_plural = "Addresses"
         ordering = ("locality", "route", "street_number")
@@ -210,12 +249,19 @@ class Address(models.Model):
 
     def save(self, *args, **kwargs):
         """Normalize component fields before saving."""
+        self.normalize()
+        self.full_clean()
+        return super().save(*args, **kwargs)
+
+    def normalize(self) -> None:
+        """Apply the component normalization `save()` performs, without saving.
+
+        Bulk writers call this before `bulk_create()`, which bypasses `save()`.
+        """
         self._synchronize_street_fields()
         self.raw = (self.raw or "").strip()
         self.formatted = (self.formatted or "").strip()
         self._auto_detect_po_box()
-        self.full_clean()
-        return super().save(*args, **kwargs)
 
     def _synchronize_street_fields(self) -> None:
         """Keep legacy `route` field in sync with `street_name`."""
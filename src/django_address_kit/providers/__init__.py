@@ -6,11 +6,14 @@ from .base import (
     GeocodeError,
     RateLimitError,
     RetryConfig,
+    geocode_many,
 )
+from .cache import CachedGeocodeAdapter
 from .google import GoogleMapsAdapter
 from .loqate import LoqateAdapter
 
 __all__ = [
+    "CachedGeocodeAdapter",
     "ConfigurationError",
     "GeocodeAdapter",
     "GeocodeError",
@@ -18,4 +21,5 @@ __all__ = [
     "LoqateAdapter",
     "RateLimitError",
     "RetryConfig",
+    "geocode_many",
 ]
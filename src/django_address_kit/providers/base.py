@@ -8,8 +8,11 @@ and rate-limit handling inside ``create_address_from_raw``.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Protocol
+from typing import Any, Iterable, Protocol, Union
+
+from django.db import connections
 
 
 class GeocodeError(RuntimeError):
@@ -41,10 +44,46 @@ class GeocodeAdapter(Protocol):
         ...
 
 
+def geocode_many(
+    adapter: GeocodeAdapter, queries: Iterable[str], *, max_workers: int = 8
+) -> dict[str, Union[dict[str, Any], GeocodeError]]:
+    """Geocode distinct queries concurrently, returning results keyed by query.
+
+    Adapters wrap blocking HTTP clients, so a thread pool overlaps the network
+    round trips. Queries that hit a ``RateLimitError`` are left out; callers
+    fall back to ``adapter.geocode`` for those so retry handling stays in
+    ``create_address_from_raw``. Any other ``GeocodeError`` is permanent, so the
+    exception itself is stored as the query's result for callers to re-raise
+    instead of paying for the same failed lookup again.
+
+    Worker threads close any database connections they opened (for example
+    through a database-backed ``CachedGeocodeAdapter``) once each lookup is
+    done, since Django will not reclaim connections held by pool threads.
+    """
+
+    unique = list(dict.fromkeys(query for query in queries if query))
+    if not unique:
+        return {}
+
+    def _lookup(query: str) -> tuple[str, Any]:
+        try:
+            return query, adapter.geocode(query)
+        except RateLimitError:
+            return query, None
+        except GeocodeError as exc:
+            return query, exc
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as pool:
+        return {query: result for query, result in pool.map(_lookup, unique) if result is not None}
+
+
 __all__ = [
     "ConfigurationError",
     "GeocodeAdapter",
     "GeocodeError",
     "RateLimitError",
     "RetryConfig",
+    "geocode_many",
 ]
@@ -0,0 +1,68 @@
+"""
+Caching wrapper for geocode adapters backed by Django's cache framework.
+
+Wrapping an adapter keeps repeated lookups for the same normalized query off the
+network. With a persistent cache backend (database, file, Redis, ...) results
+survive process restarts, so re-running an import does not re-bill the provider.
+The database backend is safe under ``geocode_many``, which closes each worker
+thread's connections after its lookup.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Optional
+
+from .base import GeocodeAdapter
+
+DEFAULT_TIMEOUT = 30 * 24 * 60 * 60
+
+
+class CachedGeocodeAdapter:
+    """Geocode adapter that memoizes another adapter's responses."""
+
+    def __init__(
+        self,
+        adapter: GeocodeAdapter,
+        *,
+        cache=None,
+        timeout: Optional[int] = DEFAULT_TIMEOUT,
+        version: str = "v1",
+    ) -> None:
+        if cache is None:
+            from django.core.cache import caches
+
+            cache = caches["default"]
+
+        self._adapter = adapter
+        self._cache = cache
+        self._timeout = timeout
+        self._version = version
+        self.provider_name = getattr(adapter, "provider_name", adapter.__class__.__name__.lower())
+
+    def geocode(self, query: str) -> dict[str, Any]:
+        """Return the cached response for ``query``, geocoding and storing it on a miss.
+
+        Errors raised by the wrapped adapter propagate and are never cached.
+        """
+
+        key = self.cache_key(query)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._adapter.geocode(query)
+        self._cache.set(key, result, timeout=self._timeout)
+        return result
+
+    def cache_key(self, query: str) -> str:
+        """Build the cache key from provider, version and the normalized query."""
+
+        normalized = " ".join((query or "").split()).casefold()
+        digest = hashlib.sha1(
+            f"{self.provider_name}|{self._version}|{normalized}".encode()
+        ).hexdigest()
+        return f"django_address_kit:geocode:{digest}"
+
+
+__all__ = ["DEFAULT_TIMEOUT", "CachedGeocodeAdapter"]
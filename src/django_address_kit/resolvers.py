@@ -9,10 +9,10 @@ at the boundaries where loosely structured address payloads enter the system
 from __future__ import annotations
 
 import time
-from dataclasses import asdict, dataclass
-from typing import Any, Callable, Optional
+from dataclasses import asdict, astuple, dataclass
+from typing import Any, Callable, Iterable, Optional
 
-from django.db import transaction
+from django.db import connections, router, transaction
 
 from .models import Address, AddressIdentifier, AddressSource, Country, Locality, State
 from .providers.base import GeocodeAdapter, GeocodeError, RateLimitError, RetryConfig
@@ -157,30 +157,42 @@ def resolve_location(payload: LocationPayload) -> Optional[Locality]:
     return resolve_locality(payload.locality_name, payload.postal_code, state=state)
 
 
-def resolve_address_from_components(
+def resolve_location_cached(
+    payload: LocationPayload, cache: Optional[dict] = None
+) -> Optional[Locality]:
+    """Resolve a location, memoizing results in ``cache`` for repeated payloads.
+
+    The cache is owned by the caller (typically one request or import batch), so
+    homogeneous batches only walk the country/state/locality chain once.
+    """
+
+    if cache is None:
+        return resolve_location(payload)
+
+    key = astuple(payload)
+    if key not in cache:
+        cache[key] = resolve_location(payload)
+    return cache[key]
+
+
+def _address_fields(
     *,
-    street_number: str = "",
-    street_name: str = "",
-    route: str = "",
-    street_type: str = "",
-    street_direction: str = "",
-    unit_type: str = "",
-    unit_number: str = "",
+    street_number: str,
+    street_name: str,
+    route: str,
+    street_type: str,
+    street_direction: str,
+    unit_type: str,
+    unit_number: str,
     raw: str,
-    formatted: str = "",
-    latitude: Optional[float] = None,
-    longitude: Optional[float] = None,
-    is_po_box: Optional[bool] = None,
-    is_military: Optional[bool] = None,
-    location: LocationPayload,
-    provider: str = "",
-    raw_payload: Optional[dict] = None,
-    components_snapshot: Optional[dict] = None,
-    metadata: Optional[dict] = None,
-) -> Address:
-    """Create or reuse an address record backed by normalized location data."""
-
-    locality = resolve_location(location)
+    formatted: str,
+    latitude: Optional[float],
+    longitude: Optional[float],
+    is_po_box: Optional[bool],
+    is_military: Optional[bool],
+    locality: Optional[Locality],
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, str]]:
+    """Split address components into lookup, defaults and optional extra fields."""
 
     cleaned_street = _clean(street_name)
     cleaned_route = _clean(route)
@@ -218,6 +230,54 @@ def resolve_address_from_components(
     # Remove None defaults so get_or_create does not attempt to persist them.
     defaults = {key: value for key, value in defaults.items() if value is not None}
 
+    return lookup, defaults, extra_defaults
+
+
+def resolve_address_from_components(
+    *,
+    street_number: str = "",
+    street_name: str = "",
+    route: str = "",
+    street_type: str = "",
+    street_direction: str = "",
+    unit_type: str = "",
+    unit_number: str = "",
+    raw: str,
+    formatted: str = "",
+    latitude: Optional[float] = None,
+    longitude: Optional[float] = None,
+    is_po_box: Optional[bool] = None,
+    is_military: Optional[bool] = None,
+    location: LocationPayload,
+    provider: str = "",
+    raw_payload: Optional[dict] = None,
+    components_snapshot: Optional[dict] = None,
+    metadata: Optional[dict] = None,
+    locality_cache: Optional[dict] = None,
+) -> Address:
+    """Create or reuse an address record backed by normalized location data."""
+
+    locality = resolve_location_cached(location, locality_cache)
+
+    lookup, defaults, extra_defaults = _address_fields(
+        street_number=street_number,
+        street_name=street_name,
+        route=route,
+        street_type=street_type,
+        street_direction=street_direction,
+        unit_type=unit_type,
+        unit_number=unit_number,
+        raw=raw,
+        formatted=formatted,
+        latitude=latitude,
+        longitude=longitude,
+        is_po_box=is_po_box,
+        is_military=is_military,
+        locality=locality,
+    )
+    cleaned_street = lookup["street_name"]
+    cleaned_route = defaults["route"]
+
     address, created = Address.objects.get_or_create(
         **lookup,
         defaults=defaults,
@@ -283,56 +343,171 @@ def create_address_from_components(
     address_data: Optional[dict] = None,
     location_data: Optional[dict] = None,
     raw: str,
+    locality_cache: Optional[dict] = None,
 ) -> Address:
     """Public helper for constructing an address from structured payloads.
 
     `address_data` is expected to resemble Google or Loqate component payloads,
     while `location_data` contains the country/state/locality identifiers.
+    `locality_cache` is an optional caller-owned dict used to memoize resolved
+    localities across calls.
+    """
+
+    return resolve_address_from_components(
+        **_component_kwargs(address_data or {}, location_data, raw),
+        locality_cache=locality_cache,
+    )
+
+
+@transaction.atomic
+def create_addresses_from_components(
+    entries: Iterable[tuple[Optional[dict], Optional[dict], str]],
+    *,
+    locality_cache: Optional[dict] = None,
+    batch_size: int = 500,
+) -> list[Address]:
+    """Bulk counterpart of `create_address_from_components`.
+
+    `entries` yields `(address_data, location_data, raw)` tuples. Addresses that
+    do not exist yet are inserted with one `bulk_create()`, and their first source
+    rows with another. Entries that match an existing row, or repeat an earlier
+    entry, go through the per-row resolver so updates and source versioning
+    behave exactly as they would one call at a time. Results follow input order.
     """
 
-    components = address_data or {}
+    cache = {} if locality_cache is None else locality_cache
+    pending = []
+    for address_data, location_data, raw in entries:
+        kwargs = _component_kwargs(address_data or {}, location_data, raw)
+        locality = resolve_location_cached(kwargs["location"], cache)
+        lookup, defaults, _ = _address_fields(
+            locality=locality,
+            **{key: value for key, value in kwargs.items() if key not in _SOURCE_KWARGS},
+        )
+        key = (
+            lookup["raw"],
+            lookup["street_number"],
+            lookup["street_name"],
+            locality.pk if locality else None,
+        )
+        pending.append((kwargs, key, lookup, defaults))
+
+    # Source rows need the new addresses' primary keys, which bulk_create() only
+    # fills in where the backend returns rows from bulk inserts (not on MySQL).
+    if not connections[router.db_for_write(Address)].features.can_return_rows_from_bulk_insert:
+        return [
+            resolve_address_from_components(**kwargs, locality_cache=cache)
+            for kwargs, _, _, _ in pending
+        ]
+
+    # Mirrors the get_or_create lookup in resolve_address_from_components.
+    seen = set(
+        Address.objects.filter(raw__in={key[0] for _, key, _, _ in pending}).values_list(
+            "raw", "street_number", "street_name", "locality_id"
+        )
+    )
+
+    results: list[Optional[Address]] = [None] * len(pending)
+    created: list[tuple[int, Address, dict]] = []
+    deferred: list[tuple[int, dict]] = []
+    for index, (kwargs, key, lookup, defaults) in enumerate(pending):
+        if key in seen:
+            deferred.append((index, kwargs))
+            continue
+        seen.add(key)
+
+        address = Address(**lookup, **defaults)
+        address.normalize()
+        address.full_clean(exclude=["locality"])
+        created.append((index, address, kwargs))
+
+    Address.objects.bulk_create([address for _, address, _ in created], batch_size=batch_size)
+    AddressSource.objects.bulk_create(
+        [
+            AddressSource(
+                address=address,
+                provider=kwargs["provider"],
+                version=1,
+                raw_payload=kwargs["raw_payload"] or {},
+                normalized_components=kwargs["components_snapshot"],
+                metadata=kwargs["metadata"] or {},
+            )
+            for _, address, kwargs in created
+            if kwargs["provider"]
+        ],
+        batch_size=batch_size,
+    )
+
+    for index, address, kwargs in created:
+        identifier_value = _provider_identifier(
+            kwargs["provider"], kwargs["raw_payload"] or {}, kwargs["metadata"] or {}
+        )
+        if identifier_value:
+            AddressIdentifier.objects.update_or_create(
+                provider=kwargs["provider"],
+                identifier=str(identifier_value),
+                defaults={"address": address},
+            )
+        results[index] = address
+
+    for index, kwargs in deferred:
+        results[index] = resolve_address_from_components(**kwargs, locality_cache=cache)
+
+    return results
+
+
+# Keyword arguments of resolve_address_from_components that describe the
+# provider source rather than the address row itself.
+_SOURCE_KWARGS = frozenset(
+    {"location", "provider", "raw_payload", "components_snapshot", "metadata"}
+)
+
+
+def _component_kwargs(components: dict, location_data: Optional[dict], raw: str) -> dict[str, Any]:
+    """Map a component payload onto `resolve_address_from_components` arguments."""
+
     location = LocationPayload.from_mapping(location_data)
-    location_snapshot = asdict(location)
+    street_name = components.get(
+        "street_name", components.get("route", components.get("street", ""))
+    )
+    route = components.get("route", components.get("street_name", ""))
+    formatted = components.get("formatted", components.get("formatted_address", ""))
     address_snapshot = {
         "street_number": components.get("street_number", ""),
-        "street_name": components.get(
-            "street_name", components.get("route", components.get("street", ""))
-        ),
+        "street_name": street_name,
         "street_type": components.get("street_type", ""),
         "street_direction": components.get("street_direction", ""),
         "unit_type": components.get("unit_type", ""),
         "unit_number": components.get("unit_number", ""),
-        "route": components.get("route", components.get("street_name", "")),
-        "formatted": components.get("formatted", components.get("formatted_address", "")),
+        "route": route,
+        "formatted": formatted,
     }
 
-    return resolve_address_from_components(
-        street_number=components.get("street_number", ""),
-        street_name=components.get(
-            "street_name", components.get("route", components.get("street", ""))
-        ),
-        route=components.get("route", components.get("street_name", "")),
-        street_type=components.get("street_type", ""),
-        street_direction=components.get("street_direction", ""),
-        unit_type=components.get("unit_type", ""),
-        unit_number=components.get("unit_number", ""),
-        raw=raw,
-        formatted=components.get("formatted", components.get("formatted_address", "")),
-        latitude=components.get("latitude"),
-        longitude=components.get("longitude"),
-        is_po_box=components.get("is_po_box"),
-        is_military=components.get("is_military"),
-        location=location,
-        provider=components.get("provider", ""),
-        raw_payload=components.get("raw_payload"),
-        components_snapshot={
+    return {
+        "street_number": address_snapshot["street_number"],
+        "street_name": street_name,
+        "route": route,
+        "street_type": address_snapshot["street_type"],
+        "street_direction": address_snapshot["street_direction"],
+        "unit_type": address_snapshot["unit_type"],
+        "unit_number": address_snapshot["unit_number"],
+        "raw": raw,
+        "formatted": formatted,
+        "latitude": components.get("latitude"),
+        "longitude": components.get("longitude"),
+        "is_po_box": components.get("is_po_box"),
+        "is_military": components.get("is_military"),
+        "location": location,
+        "provider": components.get("provider", ""),
+        "raw_payload": components.get("raw_payload"),
+        "components_snapshot": {
             "address": address_snapshot,
-            "location": location_snapshot,
+            "location": asdict(location),
             "address_components": components.get("address_components", []),
             "geometry": components.get("geometry", {}),
         },
-        metadata=components.get("metadata"),
-    )
+        "metadata": components.get("metadata"),
+    }
 
 
 def create_address_from_raw(
@@ -343,6 +518,7 @@ def create_address_from_raw(
     parser=None,
     retry_config: Optional[RetryConfig] = None,
     sleep_func: Optional[Callable[[float], None]] = None,
+    locality_cache: Optional[dict] = None,
 ) -> Address:
     """Create or reuse an address from a free-form string input.
 
@@ -352,6 +528,7 @@ def create_address_from_raw(
             structured geocode data (e.g., Google Maps response) as a mapping.
         parser: Optional callable used when `geocode_func` is unavailable;
             defaults to the library's regex-based parser.
+        locality_cache: Optional caller-owned dict memoizing resolved localities.
     """
 
     from .utils import parse_address_components, standardize_address
@@ -433,15 +610,14 @@ def create_address_from_raw(
 
     if structured:
         formatted_raw = (
-            structured.get("formatted")
-            or structured.get("formatted_address")
-            or normalized_raw
+            structured.get("formatted") or structured.get("formatted_address") or normalized_raw
         )
         formatted_raw = standardize_address(formatted_raw) if formatted_raw else normalized_raw
         return create_address_from_components(
             address_data=structured,
             location_data=location_data,
             raw=formatted_raw,
+            locality_cache=locality_cache,
         )
 
     address, _ = Address.objects.get_or_create(
@@ -482,15 +658,7 @@ def _record_address_source(
         id__in=ids_to_keep
     ).delete()
 
-    identifier_value = None
-    if provider == "google":
-        identifier_value = metadata.get("place_id") or raw_payload.get("place_id")
-        results = raw_payload.get("results")
-        if not identifier_value and isinstance(results, list) and results:
-            identifier_value = results[0].get("place_id")
-    elif provider == "loqate":
-        identifier_value = metadata.get("id") or raw_payload.get("Id")
-
+    identifier_value = _provider_identifier(provider, raw_payload, metadata)
     if identifier_value:
         AddressIdentifier.objects.update_or_create(
             provider=provider,
@@ -499,3 +667,17 @@ def _record_address_source(
         )
 
     return source
+
+
+def _provider_identifier(provider: str, raw_payload: dict, metadata: dict) -> Optional[Any]:
+    """Return the provider's stable identifier (place ID, etc.) when present."""
+
+    identifier_value = None
+    if provider == "google":
+        identifier_value = metadata.get("place_id") or raw_payload.get("place_id")
+        results = raw_payload.get("results")
+        if not identifier_value and isinstance(results, list) and results:
+            identifier_value = results[0].get("place_id")
+    elif provider == "loqate":
+        identifier_value = metadata.get("id") or raw_payload.get("Id")
+    return identifier_value
@@ -10,8 +10,12 @@ Provides full CRUD serializers for:
 Supports both simple string input and structured object input for addresses.
 """
 
+from __future__ import annotations
+
+from functools import lru_cache
 from typing import Optional
 
+from django.db import models
 from rest_framework import serializers
 
 from .models import Address, AddressIdentifier, AddressSource, Country, Locality, State
@@ -19,7 +23,7 @@ from .resolvers import (
     LocationPayload,
     create_address_from_components,
     create_address_from_raw,
-    resolve_location,
+    resolve_location_cached,
 )
 
 
@@ -36,7 +40,9 @@ class CountrySerializer(serializers.ModelSerializer):
     def validate(self, attrs: dict) -> dict:
         """Validate country data."""
         if attrs.get("code") and len(attrs["code"]) != 2:
-            raise serializers.ValidationError("Country code must be 2 characters")
+            raise serializers.ValidationError(
+                "Country code must be 2 characters", code="country_code_length"
+            )
         return attrs
 
     def create(self, validated_data: dict) -> Country:
@@ -71,7 +77,9 @@ class StateSerializer(serializers.ModelSerializer):
     def validate(self, attrs: dict) -> dict:
         """Validate state data."""
         if attrs.get("code") and len(attrs["code"]) > 8:
-            raise serializers.ValidationError("State code must be 8 characters or less")
+            raise serializers.ValidationError(
+                "State code must be 8 characters or less", code="state_code_length"
+            )
         return attrs
 
     def create(self, validated_data: dict) -> State:
@@ -118,7 +126,9 @@ class LocalitySerializer(serializers.ModelSerializer):
     def validate_postal_code(self, value: str) -> str:
         """Validate postal code format."""
         if value and not any(c.isdigit() for c in value):
-            raise serializers.ValidationError("Postal code must contain at least one number")
+            raise serializers.ValidationError(
+                "Postal code must contain at least one number", code="postal_code_digits"
+            )
         return value
 
     def create(self, validated_data: dict) -> Locality:
@@ -157,6 +167,70 @@ class LocalitySerializer(serializers.ModelSerializer):
         return instance
 
 
+class AddressListSerializer(serializers.ListSerializer):
+    """
+    List serializer that renders address querysets from ``values()`` rows.
+
+    List endpoints only read data, so instead of hydrating an ``Address`` (and its
+    locality chain) per row we fetch flat column tuples and reshape them into the
+    same nested payload ``AddressSerializer`` produces. Sources and identifiers are
+    loaded with one grouped query each. Anything that is not a queryset falls back
+    to the default per-instance rendering.
+
+    Bulk creates share a ``locality_cache`` through the serializer context so a
+    batch of addresses in the same locality resolves the hierarchy only once.
+    """
+
+    def create(self, validated_data: list) -> list:
+        self.context.setdefault("locality_cache", {})
+        return super().create(validated_data)
+
+    def to_representation(self, data):
+        if isinstance(data, models.Manager):
+            data = data.all()
+        if not isinstance(data, models.QuerySet) or not _renders_from_values(self.child):
+            return super().to_representation(data)
+
+        fields = self.child.fields
+        if not _ADDRESS_VALUE_FIELDS.union(_NESTED_FIELDS).issuperset(fields):
+            return super().to_representation(data)
+
+        flat_fields = [name for name in fields if name in _ADDRESS_VALUE_FIELDS]
+        # "id" keys the related rows even when the child serializer does not expose it.
+        columns = dict.fromkeys(["id", *flat_fields, *_LOCALITY_VALUE_FIELDS])
+        rows = list(data.values(*columns))
+        if not rows:
+            return []
+
+        # A subquery keeps the related lookups bounded; sliced querysets cannot be
+        # used as ``__in`` subqueries on every backend, so those pass the ids.
+        addresses = [row["id"] for row in rows] if data.query.is_sliced else data.values("pk")
+
+        sources: dict[int, list[dict]] = {}
+        if "sources" in fields:
+            sources = _group_values(
+                AddressSource.objects.filter(address__in=addresses).order_by("-version"),
+                AddressSourceSerializer(context=self.context).fields,
+            )
+        identifiers: dict[int, list[dict]] = {}
+        if "identifiers" in fields:
+            identifiers = _group_values(
+                AddressIdentifier.objects.filter(address__in=addresses).order_by(
+                    "provider", "identifier"
+                ),
+                AddressIdentifierSerializer().fields,
+            )
+
+        results = []
+        for row in rows:
+            item = _render_values(fields, row, flat_fields)
+            item["locality"] = _locality_from_values(row)
+            item["sources"] = sources.get(row["id"], [])
+            item["identifiers"] = identifiers.get(row["id"], [])
+            results.append({name: item[name] for name in fields})
+        return results
+
+
 class AddressSerializer(serializers.ModelSerializer):
     """
     Serializer for US address handling.
@@ -203,11 +277,12 @@ class AddressSerializer(serializers.ModelSerializer):
             "identifiers",
         ]
         read_only_fields = ["id", "sources", "identifiers"]
+        list_serializer_class = AddressListSerializer
 
     def validate_raw(self, value: str) -> str:
         """Validate that raw address is not empty."""
         if not value or not value.strip():
-            raise serializers.ValidationError("Raw address cannot be empty")
+            raise serializers.ValidationError("Raw address cannot be empty", code="blank")
         return value
 
     def create(self, validated_data: dict) -> Address:
@@ -221,6 +296,7 @@ class AddressSerializer(serializers.ModelSerializer):
                 address_data=components,
                 location_data=locality_payload,
                 raw=raw_value,
+                locality_cache=self.context.get("locality_cache"),
             )
 
         return create_address_from_raw(
@@ -228,6 +304,7 @@ class AddressSerializer(serializers.ModelSerializer):
             geocode_adapter=self.context.get("geocode_adapter"),
             geocode_func=self.context.get("geocode_func"),
             parser=self.context.get("parser"),
+            locality_cache=self.context.get("locality_cache"),
         )
 
     def update(self, instance: Address, validated_data: dict) -> Address:
@@ -235,7 +312,10 @@ class AddressSerializer(serializers.ModelSerializer):
         locality_payload = _extract_location_payload(validated_data.pop("locality", None))
 
         if locality_payload is not None:
-            locality = resolve_location(LocationPayload.from_mapping(locality_payload))
+            locality = resolve_location_cached(
+                LocationPayload.from_mapping(locality_payload),
+                self.context.get("locality_cache"),
+            )
             instance.locality = locality
 
         components = _extract_address_components(validated_data)
@@ -249,12 +329,20 @@ class AddressSerializer(serializers.ModelSerializer):
         return instance
 
     def get_sources(self, instance: Address) -> list[dict]:
-        sources = instance.sources.order_by("-version")
+        if _is_prefetched(instance, "sources"):
+            sources = sorted(instance.sources.all(), key=lambda source: -source.version)
+        else:
+            sources = instance.sources.order_by("-version")
         serializer = AddressSourceSerializer(sources, many=True, context=self.context)
         return serializer.data
 
     def get_identifiers(self, instance: Address) -> list[dict]:
-        identifiers = instance.identifiers.order_by("provider", "identifier")
+        if _is_prefetched(instance, "identifiers"):
+            identifiers = sorted(
+                instance.identifiers.all(), key=lambda item: (item.provider, item.identifier)
+            )
+        else:
+            identifiers = instance.identifiers.order_by("provider", "identifier")
         serializer = AddressIdentifierSerializer(identifiers, many=True)
         return serializer.data
 
@@ -280,6 +368,127 @@ class AddressIdentifierSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+_ADDRESS_VALUE_FIELDS = frozenset(
+    {
+        "id",
+        "street_number",
+        "street_name",
+        "street_type",
+        "street_direction",
+        "unit_type",
+        "unit_number",
+        "route",
+        "raw",
+        "formatted",
+        "latitude",
+        "longitude",
+        "is_po_box",
+        "is_military",
+    }
+)
+
+_NESTED_FIELDS = ("locality", "sources", "identifiers")
+
+_LOCALITY_VALUE_FIELDS = (
+    "locality_id",
+    "locality__name",
+    "locality__postal_code",
+    "locality__state_id",
+    "locality__state__name",
+    "locality__state__code",
+    "locality__state__country_id",
+    "locality__state__country__name",
+    "locality__state__country__code",
+)
+
+
+def _renders_from_values(child: serializers.Serializer) -> bool:
+    """Return True unless ``child`` customizes per-instance rendering.
+
+    The ``values()`` fast path reproduces ``AddressSerializer`` output; subclasses
+    that override ``to_representation`` or the related-field getters, or that
+    redeclare a field with another class or source, need the regular
+    per-instance path to keep their behavior.
+    """
+
+    child_cls = type(child)
+    if not all(
+        getattr(child_cls, name) is getattr(AddressSerializer, name)
+        for name in ("to_representation", "get_sources", "get_identifiers")
+    ):
+        return False
+
+    defaults = _address_field_signatures()
+    return all(
+        defaults.get(name) == _field_signature(field) for name, field in child.fields.items()
+    )
+
+
+@lru_cache(maxsize=None)
+def _address_field_signatures() -> dict[str, tuple]:
+    """Return the class/source signature of every ``AddressSerializer`` field."""
+
+    return {name: _field_signature(field) for name, field in AddressSerializer().fields.items()}
+
+
+def _field_signature(field: serializers.Field) -> tuple:
+    """Return what decides how ``field`` reads and renders its value."""
+
+    return type(field), field.source, getattr(field, "method_name", None)
+
+
+def _is_prefetched(instance: models.Model, relation: str) -> bool:
+    """Return True when ``prefetch_related`` already loaded ``relation`` for ``instance``."""
+
+    return relation in getattr(instance, "_prefetched_objects_cache", {})
+
+
+def _render_values(fields, row: dict, names) -> dict:
+    """Render a ``values()`` row through the serializer's own field converters."""
+
+    return {
+        name: None if row[name] is None else fields[name].to_representation(row[name])
+        for name in names
+    }
+
+
+def _group_values(queryset, fields) -> dict[int, list[dict]]:
+    """Render related rows with ``fields`` and group them by ``address_id``."""
+
+    names = list(fields)
+    grouped: dict[int, list[dict]] = {}
+    for row in queryset.values("address_id", *names):
+        grouped.setdefault(row["address_id"], []).append(_render_values(fields, row, names))
+    return grouped
+
+
+def _locality_from_values(row: dict) -> Optional[dict]:
+    """Rebuild the nested locality payload from flattened ``values()`` columns."""
+
+    if row["locality_id"] is None:
+        return None
+
+    state = None
+    if row["locality__state_id"] is not None:
+        country = None
+        if row["locality__state__country_id"] is not None:
+            country = {
+                "name": row["locality__state__country__name"],
+                "code": row["locality__state__country__code"],
+            }
+        state = {
+            "name": row["locality__state__name"],
+            "code": row["locality__state__code"],
+            "country": country,
+        }
+
+    return {
+        "name": row["locality__name"],
+        "postal_code": row["locality__postal_code"],
+        "state": state,
+    }
+
+
 def _extract_address_components(data: dict) -> dict:
     """Extract address component fields from validated serializer data."""
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Dict
 
 from .constants import STREET_SUFFIXES, UNIT_TYPES
@@ -18,13 +19,26 @@ UNIT_RE = re.compile(
 CITY_STATE_RE = re.compile(
     r"(?P<city>[^,]+),\s*(?P<state>[A-Z]{2})\s*(?P<zipcode>\d{5}(?:-\d{4})?)?$"
 )
+WHITESPACE_RE = re.compile(r"\s+")
 CARDINAL_DIRECTIONS = {"N", "S", "E", "W", "NE", "NW", "SE", "SW"}
 STREET_SUFFIX_LOOKUP = {
     **{key.upper(): key.title() for key in STREET_SUFFIXES},
     **{abbr.upper(): abbr for abbr in STREET_SUFFIXES.values()},
 }
+UNIT_TYPE_LOOKUP = {
+    **{abbr.upper(): abbr for abbr in UNIT_TYPES.values()},
+    **{name.upper(): abbr for name, abbr in UNIT_TYPES.items()},
+}
+_UNIT_STRIP_TABLE = str.maketrans("", "", ".#")
+# Parsing is a pure function of the input string; bulk imports repeat many values.
+_CACHE_SIZE = 10_000
+_STREET_SUFFIX_NAMES = {abbr: long_name.title() for long_name, abbr in STREET_SUFFIXES.items()}
+_STREET_SUFFIX_RE = re.compile(
+    rf"\b(?:{'|'.join(map(re.escape, _STREET_SUFFIX_NAMES))})\b", re.IGNORECASE
+)
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def normalize_string(value: str) -> str:
     """
     Normalize a string by stripping whitespace and standardizing formatting.
@@ -38,7 +52,7 @@ def normalize_string(value: str) -> str:
     if not value:
         return value
 
-    normalized = re.sub(r"\s+", " ", value).strip()
+    normalized = WHITESPACE_RE.sub(" ", value).strip()
     return normalized.title() if normalized.isupper() else normalized
 
 
@@ -55,6 +69,14 @@ def parse_address_components(address: str) -> Dict[str, str]:
     if not address:
         return {}
 
+    # Callers own (and may mutate) the returned dict, so hand out a fresh copy.
+    return dict(_parse_address_components(address))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_address_components(address: str) -> tuple[tuple[str, str], ...]:
+    """Cached worker for ``parse_address_components``; returns component pairs."""
+
     working = address.strip()
     components: Dict[str, str] = {}
 
@@ -83,7 +105,7 @@ def parse_address_components(address: str) -> Dict[str, str]:
         components["unit_number"] = unit_number.strip()
         working = UNIT_RE.sub("", working).strip(", ")
 
-    tokens = [token for token in re.split(r"\s+", working) if token]
+    tokens = working.split()
 
     if tokens and tokens[0].isdigit():
         components["street_number"] = tokens.pop(0)
@@ -100,7 +122,7 @@ def parse_address_components(address: str) -> Dict[str, str]:
 
         components["street_name"] = " ".join(tokens).strip(", ")
 
-    return {key: value for key, value in components.items() if value}
+    return tuple((key, value) for key, value in components.items() if value)
 
 
 def standardize_address(address: str) -> str:
@@ -118,23 +140,20 @@ def standardize_address(address: str) -> str:
 
     address = normalize_string(address)
 
-    for long_name, abbr in STREET_SUFFIXES.items():
-        pattern = re.compile(rf"\b{abbr}\b", re.IGNORECASE)
-        address = pattern.sub(long_name.title(), address)
+    return _STREET_SUFFIX_RE.sub(_expand_street_suffix, address)
 
-    return address
 
+def _expand_street_suffix(match: re.Match) -> str:
+    """Replace a matched USPS suffix abbreviation with its full name."""
 
-def _normalize_unit_type(raw_type: str) -> str:
-    """Normalize unit labels to USPS-style abbreviations."""
+    return _STREET_SUFFIX_NAMES[match.group(0).upper()]
 
-    cleaned = raw_type.replace(".", "").replace("#", "").upper()
 
-    for name, abbr in UNIT_TYPES.items():
-        if cleaned == name or cleaned == abbr:
-            return abbr
+def _normalize_unit_type(raw_type: str) -> str:
+    """Normalize unit labels to USPS-style abbreviations."""
 
-    return cleaned or raw_type
+    cleaned = raw_type.translate(_UNIT_STRIP_TABLE).upper()
+    return UNIT_TYPE_LOOKUP.get(cleaned) or cleaned or raw_type
 
 
 __all__ = ["normalize_string", "parse_address_components", "standardize_address"]
@@ -1,11 +1,33 @@
 """US address validators for django-address-kit"""
 
+from __future__ import annotations
+
 import re
+from typing import Iterable
+
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
 
 from .constants import ALL_STATE_CODES
 
+# Compiled once at import. ``re.ASCII`` keeps ``\d``/``\s`` to ASCII so look-alike
+# digits (e.g. full-width) are rejected. The RegexValidator patterns stay anchored
+# because Django calls ``search()``; the rest are applied with ``fullmatch()``.
+_STATE_CODE_RE = re.compile(r"^[A-Z]{2}\Z", re.ASCII)
+_ZIP_CODE_RE = re.compile(r"^\d{5}(-\d{4})?\Z", re.ASCII)
+_PO_BOX_RE = re.compile(r"(P\.?\s*O\.?\s*(Box|B\.?)|POB\.?)\s+\d+", re.IGNORECASE | re.ASCII)
+_STREET_NUMBER_RE = re.compile(r"\d", re.ASCII)
+_STREET_NAME_RE = re.compile(r"[a-zA-Z]")
+# Unicode ``\w`` on purpose: street names such as "Cañon" are valid.
+_STREET_CHARS_RE = re.compile(r"[\w\s\.\-\#\,\/]+")
+
+
+def _as_str(value) -> str:
+    """Coerce non-string input (ints, lazy strings, objects with ``__str__``) to ``str``."""
+
+    # ``type() is str`` is the common case and skips the ``str()`` call entirely.
+    return value if type(value) is str else str(value)
+
 
 def validate_state_code(value: str) -> None:
     """
@@ -24,19 +46,21 @@ def validate_state_code(value: str) -> None:
         >>> validate_state_code('ZZ')  # Raises ValidationError
     """
     if not value:
-        raise ValidationError("State code is required.")
+        raise ValidationError("State code is required.", code="required")
 
     # Convert to uppercase for case-insensitive validation
-    state_code = value.strip().upper()
+    state_code = _as_str(value).strip().upper()
 
     if len(state_code) != 2:
         raise ValidationError(
-            f"State code must be exactly 2 characters. Got: {len(state_code)} characters."
+            f"State code must be exactly 2 characters. Got: {len(state_code)} characters.",
+            code="invalid",
         )
 
     if state_code not in ALL_STATE_CODES:
         raise ValidationError(
-            f'"{value}" is not a valid US state, territory, or military postal code.'
+            f'"{value}" is not a valid US state, territory, or military postal code.',
+            code="invalid",
         )
 
 
@@ -56,19 +80,28 @@ def validate_zip_code(value: str) -> None:
         >>> validate_zip_code('1234')        # Raises ValidationError
     """
     if not value:
-        raise ValidationError("ZIP code is required.")
-
-    zip_code = value.strip()
+        raise ValidationError("ZIP code is required.", code="required")
 
-    # Pattern for 5-digit ZIP or ZIP+4 format
-    zip_pattern = r"^\d{5}(-\d{4})?$"
+    zip_code = _as_str(value).strip()
 
-    if not re.match(zip_pattern, zip_code):
+    if not _is_zip_code(zip_code):
         raise ValidationError(
-            f'"{value}" is not a valid ZIP code. Use 5-digit (12345) or ZIP+4 (12345-6789) format.'
+            f'"{value}" is not a valid ZIP code. Use 5-digit (12345) or ZIP+4 (12345-6789) format.',
+            code="invalid",
         )
 
 
+def _is_zip_code(value: str) -> bool:
+    """Return True for ``12345`` or ``12345-6789`` made of ASCII digits."""
+    # Length and str methods run in C and bail out early, so oversized or
+    # non-ASCII (e.g. full-width digit) input is rejected without a regex pass.
+    if not value.isascii():
+        return False
+    if len(value) == 5:
+        return value.isdigit()
+    return len(value) == 10 and value[5] == "-" and value[:5].isdigit() and value[6:].isdigit()
+
+
 def validate_street_address(value: str) -> None:
     """
     Validate basic US street address format.
@@ -92,25 +125,29 @@ def validate_street_address(value: str) -> None:
         >>> validate_street_address('Main St')                # Raises ValidationError (no number)
     """
     if not value:
-        raise ValidationError("Street address is required.")
+        raise ValidationError("Street address is required.", code="required")
 
-    address = value.strip()
+    address = _as_str(value).strip()
 
     if len(address) < 5:
-        raise ValidationError("Street address must be at least 5 characters long.")
+        raise ValidationError(
+            "Street address must be at least 5 characters long.",
+            code="min_length",
+        )
 
     # Must start with a number (street number)
-    if not re.match(r"^\d", address):
-        raise ValidationError("Street address must start with a street number.")
+    if not _STREET_NUMBER_RE.match(address):
+        raise ValidationError("Street address must start with a street number.", code="invalid")
 
     # Must contain at least one letter (street name)
-    if not re.search(r"[a-zA-Z]", address):
-        raise ValidationError("Street address must contain a street name.")
+    if not _STREET_NAME_RE.search(address):
+        raise ValidationError("Street address must contain a street name.", code="invalid")
 
     # Check for valid characters (alphanumeric, spaces, and common punctuation)
-    if not re.match(r"^[\w\s\.\-\#\,\/]+$", address):
+    if not _STREET_CHARS_RE.fullmatch(address):
         raise ValidationError(
-            "Street address contains invalid characters. Use only letters, numbers, spaces, and common punctuation (., -, #, ,, /)."
+            "Street address contains invalid characters. Use only letters, numbers, spaces, and common punctuation (., -, #, ,, /).",
+            code="invalid",
         )
 
 
@@ -137,27 +174,53 @@ def validate_po_box(value: str) -> None:
         >>> validate_po_box('Box 123')        # Raises ValidationError (missing PO/P.O.)
     """
     if not value:
-        raise ValidationError("PO Box is required.")
+        raise ValidationError("PO Box is required.", code="required")
 
-    po_box = value.strip()
+    po_box = _as_str(value).strip()
 
-    # Pattern for various PO Box formats
     # Matches: PO Box, P.O. Box, P O Box, POB, P.O.B, etc.
-    po_box_pattern = r"^(P\.?\s*O\.?\s*(Box|B\.?)|POB\.?)\s+\d+$"
-
-    if not re.match(po_box_pattern, po_box, re.IGNORECASE):
+    if not _PO_BOX_RE.fullmatch(po_box):
         raise ValidationError(
-            f'"{value}" is not a valid PO Box format. Use formats like "PO Box 123", "P.O. Box 123", or "POB 123".'
+            f'"{value}" is not a valid PO Box format. Use formats like "PO Box 123", "P.O. Box 123", or "POB 123".',
+            code="invalid",
         )
 
 
+def validate_state_codes(values: Iterable[str]) -> list[bool]:
+    """
+    Check a column of state codes in one pass, e.g. for bulk imports.
+
+    Applies the same rules as ``validate_state_code`` but reports validity per
+    value instead of raising, so callers avoid building an exception per bad row.
+
+    Examples:
+        >>> validate_state_codes(['CA', 'ny', 'ZZ'])
+        [True, True, False]
+    """
+    return [bool(value) and _as_str(value).strip().upper() in ALL_STATE_CODES for value in values]
+
+
+def validate_zip_codes(values: Iterable[str]) -> list[bool]:
+    """
+    Check a column of ZIP codes in one pass, e.g. for bulk imports.
+
+    Applies the same rules as ``validate_zip_code`` but reports validity per value
+    instead of raising.
+
+    Examples:
+        >>> validate_zip_codes(['12345', '12345-6789', '1234'])
+        [True, True, False]
+    """
+    return [bool(value) and _is_zip_code(_as_str(value).strip()) for value in values]
+
+
 # Django RegexValidator instances for use in model fields
 state_code_validator = RegexValidator(
-    regex=r"^[A-Z]{2}$",
+    regex=_STATE_CODE_RE,
     message="State code must be a valid 2-letter US state, territory, or military postal code.",
 )
 
 zip_code_validator = RegexValidator(
-    regex=r"^\d{5}(-\d{4})?$",
+    regex=_ZIP_CODE_RE,
     message="ZIP code must be in 5-digit (12345) or ZIP+4 (12345-6789) format.",
 )
@@ -2,17 +2,32 @@
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
+import itertools
 import random
+from pathlib import Path
 
+import django
 import pytest
+from django.apps import apps
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+import django_address_kit.migrations
+from django_address_kit.models import Address, Country, Locality, State
 
 from . import factories
 
 pytest_plugins = ["pytest_django"]
 
-try:  # pragma: no cover - exercised in integration tests
+_FAKER_SEED = 8675309
+
+# Probe with find_spec so a missing Faker never raises during collection.
+if importlib.util.find_spec("faker") is not None:  # pragma: no cover - integration path
     from faker import Faker  # type: ignore
-except Exception:  # pragma: no cover - fallback when Faker is unavailable
+else:  # pragma: no cover - fallback when Faker is unavailable
 
     class Faker:  # type: ignore
         """Minimal fallback Faker implementation for offline test environments."""
@@ -22,94 +37,216 @@ except Exception:  # pragma: no cover - fallback when Faker is unavailable
         _CITIES = ["San Francisco", "New York", "Austin", "Seattle"]
         _STREET_SUFFIXES = ["Street", "Avenue", "Road", "Boulevard", "Parkway"]
 
+        _POOL_SIZE = 1024
+
         def __init__(self) -> None:
-            self._rand = random.Random(8675309)
+            self._rand = random.Random(_FAKER_SEED)
+            self._choice = self._rand.choice
+            rand, size = self._rand, self._POOL_SIZE
+            self._postcodes = itertools.cycle(
+                [str(rand.randint(10000, 99999)) for _ in range(size)]
+            )
+            self._building_numbers = itertools.cycle(
+                [str(rand.randint(1, 999)) for _ in range(size)]
+            )
+            self._latitudes = itertools.cycle(
+                [round(rand.uniform(-90, 90), 6) for _ in range(size)]
+            )
+            self._longitudes = itertools.cycle(
+                [round(rand.uniform(-180, 180), 6) for _ in range(size)]
+            )
 
         def country_code(self) -> str:
-            return self._rand.choice(self._COUNTRIES)[0]
+            return self._choice(self._COUNTRIES)[0]
 
         def country(self) -> str:
-            return self._rand.choice(self._COUNTRIES)[1]
+            return self._choice(self._COUNTRIES)[1]
 
         def state(self) -> str:
-            return self._rand.choice(self._STATES)[1]
+            return self._choice(self._STATES)[1]
 
         def state_abbr(self) -> str:
-            return self._rand.choice(self._STATES)[0]
+            return self._choice(self._STATES)[0]
 
         def city(self) -> str:
-            return self._rand.choice(self._CITIES)
+            return self._choice(self._CITIES)
 
         def postcode(self) -> str:
-            return str(self._rand.randint(10000, 99999))
+            return next(self._postcodes)
 
         def building_number(self) -> str:
-            return str(self._rand.randint(1, 999))
+            return next(self._building_numbers)
 
         def street_name(self) -> str:
-            return self._rand.choice(["Market", "Mission", "Elm", "Oak", "Pine"])
+            return self._choice(["Market", "Mission", "Elm", "Oak", "Pine"])
 
         def street_suffix(self) -> str:
-            return self._rand.choice(self._STREET_SUFFIXES)
+            return self._choice(self._STREET_SUFFIXES)
 
         def random_element(self, elements):
-            return self._rand.choice(elements)
+            return self._choice(elements)
 
         def latitude(self) -> float:
-            return round(self._rand.uniform(-90, 90), 6)
+            return next(self._latitudes)
 
         def longitude(self) -> float:
-            return round(self._rand.uniform(-180, 180), 6)
+            return next(self._longitudes)
+
+
+@receiver(connection_created)
+def _tune_sqlite_connection(sender, connection, **kwargs) -> None:
+    """Trade durability for speed on the throwaway SQLite test database."""
+
+    if connection.vendor != "sqlite":
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
+
+
+def pytest_collection_modifyitems(config, items) -> None:
+    """Reject tests that would flush the session-scoped address graph.
+
+    Transactional tests truncate every table on teardown, which wipes the rows
+    ``_address_graph`` seeds once per session; keep tests on rollback isolation.
+    """
+
+    for item in items:
+        marker = item.get_closest_marker("django_db")
+        transactional = marker is not None and (
+            marker.kwargs.get("transaction") or (marker.args and marker.args[0])
+        )
+        if transactional or "transactional_db" in getattr(item, "fixturenames", ()):
+            raise pytest.UsageError(
+                f"{item.nodeid} requests a transactional database; the shared test "
+                "data relies on rollback isolation."
+            )
+
+
+def _schema_digest() -> str:
+    """Hash everything the test schema is built from so changes get a fresh database.
+
+    That is the app's migration files plus, for apps whose migrations are
+    disabled in ``MIGRATION_MODULES``, the model modules their tables are
+    synced from. The Django version is included because it ships the contrib
+    models.
+    """
+
+    paths = sorted(Path(django_address_kit.migrations.__file__).parent.glob("*.py"))
+    for label, module in sorted(settings.MIGRATION_MODULES.items()):
+        if module is None:
+            paths.append(Path(apps.get_app_config(label).models_module.__file__))
+
+    digest = hashlib.sha1(django.get_version().encode())
+    for path in paths:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(django_db_modify_db_settings_parallel_suffix) -> None:
+    """Key the file-backed test database on the schema sources' contents.
+
+    ``--reuse-db`` then picks up a warm database whenever the schema is
+    unchanged and builds a new one, rather than reusing a stale file, when it
+    is not.
+    """
+
+    test_settings = settings.DATABASES["default"].setdefault("TEST", {})
+    name = test_settings.get("NAME")
+    if not name or name == ":memory:":
+        return
+
+    path = Path(name)
+    test_settings["NAME"] = str(path.with_name(f"{path.stem}-{_schema_digest()}{path.suffix}"))
+
+
+_FAKER = Faker()
+if hasattr(_FAKER, "seed_instance"):
+    _FAKER.seed_instance(_FAKER_SEED)
 
 
 @pytest.fixture(scope="session")
 def faker() -> Faker:
-    """Provide a module-scoped Faker instance."""
+    """Provide the shared, seeded Faker instance."""
+
+    return _FAKER
 
-    return Faker()
+
+@pytest.fixture(scope="session")
+def _address_graph(django_db_setup, django_db_blocker, faker: Faker):
+    """Create the shared United States/California/San Francisco rows once per session.
+
+    The rows are committed outside the per-test transaction, so every test sees
+    them while the ``db`` fixture still rolls back whatever a test changes.
+    """
+
+    with django_db_blocker.unblock():
+        country = factories.create_country(faker, code="US", name="United States", reuse=True)
+        state = factories.create_state(
+            faker, country=country, name="California", code="CA", reuse=True
+        )
+        locality = factories.create_locality(
+            faker,
+            state=state,
+            name="San Francisco",
+            postal_code="94102",
+            reuse=True,
+        )
+        address = factories.create_address(
+            faker,
+            locality=locality,
+            street_number="123",
+            street_name="Market",
+            street_type="Street",
+            unit_type="Suite",
+            unit_number="100",
+        )
+
+    yield {
+        "country": country.pk,
+        "state": state.pk,
+        "locality": locality.pk,
+        "address": address.pk,
+    }
+
+    with django_db_blocker.unblock():
+        Country.objects.filter(pk=country.pk).delete()
 
 
 @pytest.fixture
-def country_instance(db, faker: Faker):
-    """Create a reusable United States country instance."""
+def country_instance(db, _address_graph):
+    """Return the shared United States country instance."""
 
-    return factories.create_country(faker, code="US", name="United States")
+    return Country.objects.get(pk=_address_graph["country"])
 
 
 @pytest.fixture
-def state_instance(db, faker: Faker, country_instance):
-    """Create a reusable California state instance."""
-
-    return factories.create_state(
-        faker,
-        country=country_instance,
-        name="California",
-        code="CA",
-    )
+def state_instance(db, _address_graph):
+    """Return the shared California state instance."""
+
+    return State.objects.select_related("country").get(pk=_address_graph["state"])
 
 
 @pytest.fixture
-def locality_instance(db, faker: Faker, state_instance):
-    """Create a reusable San Francisco locality instance."""
-
-    return factories.create_locality(
-        faker,
-        state=state_instance,
-        name="San Francisco",
-        postal_code="94102",
-    )
+def locality_instance(db, _address_graph):
+    """Return the shared San Francisco locality instance."""
+
+    return Locality.objects.select_related("state__country").get(pk=_address_graph["locality"])
 
 
 @pytest.fixture
-def address_instance(db, faker: Faker, locality_instance):
-    """Create a reusable address instance for tests."""
-
-    return factories.create_address(
-        faker,
-        locality=locality_instance,
-        street_number="123",
-        street_name="Market",
-        street_type="Street",
-        unit_type="Suite",
-        unit_number="100",
+def address_instance(db, _address_graph):
+    """Return the shared address instance with its geography already joined.
+
+    Each test receives a freshly loaded object, so in-memory mutations never leak
+    between tests.
+    """
+
+    return Address.objects.select_related("locality__state__country").get(
+        pk=_address_graph["address"]
     )
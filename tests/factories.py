@@ -2,24 +2,41 @@
 
 from __future__ import annotations
 
+import os
 from typing import Any, Optional
 
 from django_address_kit.models import Address, Country, Locality, State
 
+DEFAULT_BULK_BATCH_SIZE = int(os.environ.get("ADDRESS_KIT_BULK_BATCH_SIZE", "100"))
 
-def create_country(faker, **overrides) -> Country:
-    """Return a Country instance with realistic defaults."""
+
+def build_country(faker, **overrides) -> Country:
+    """Return an unsaved Country instance with realistic defaults."""
 
     data: dict[str, Any] = {
         "code": overrides.pop("code", faker.country_code())[:2].upper(),
         "name": overrides.pop("name", faker.country()),
     }
     data.update(overrides)
-    return Country.objects.create(**data)
+    return Country(**data)
+
+
+def create_country(faker, *, reuse: bool = False, **overrides) -> Country:
+    """Return a Country instance with realistic defaults.
 
+    With ``reuse=True`` an existing country with the same code is returned
+    instead of inserting a new row.
+    """
 
-def create_state(faker, *, country: Optional[Country] = None, **overrides) -> State:
-    """Return a State associated with the provided country."""
+    country = build_country(faker, **overrides)
+    if reuse:
+        return Country.objects.get_or_create(code=country.code, defaults={"name": country.name})[0]
+    country.save(force_insert=True)
+    return country
+
+
+def build_state(faker, *, country: Optional[Country] = None, **overrides) -> State:
+    """Return an unsaved State associated with the provided country."""
 
     country = country or create_country(faker)
     data: dict[str, Any] = {
@@ -28,16 +45,37 @@ def create_state(faker, *, country: Optional[Country] = None, **overrides) -> St
         "country": country,
     }
     data.update(overrides)
-    return State.objects.create(**data)
+    return State(**data)
 
 
-def create_locality(
+def create_state(
+    faker,
+    *,
+    country: Optional[Country] = None,
+    reuse: bool = False,
+    **overrides,
+) -> State:
+    """Return a State associated with the provided country.
+
+    With ``reuse=True`` the state is looked up by ``(country, code)`` first.
+    """
+
+    state = build_state(faker, country=country, **overrides)
+    if reuse:
+        return State.objects.get_or_create(
+            country=state.country, code=state.code, defaults={"name": state.name}
+        )[0]
+    state.save(force_insert=True)
+    return state
+
+
+def build_locality(
     faker,
     *,
     state: Optional[State] = None,
     **overrides,
 ) -> Locality:
-    """Return a Locality associated with the provided state."""
+    """Return an unsaved Locality associated with the provided state."""
 
     state = state or create_state(faker)
     data: dict[str, Any] = {
@@ -46,47 +84,111 @@ def create_locality(
         "state": state,
     }
     data.update(overrides)
-    return Locality.objects.create(**data)
+    return Locality(**data)
 
 
-def create_address(
+def create_locality(
+    faker,
+    *,
+    state: Optional[State] = None,
+    reuse: bool = False,
+    **overrides,
+) -> Locality:
+    """Return a Locality associated with the provided state.
+
+    With ``reuse=True`` the locality is looked up by ``(state, name, postal_code)``
+    first.
+    """
+
+    locality = build_locality(faker, state=state, **overrides)
+    if reuse:
+        return Locality.objects.get_or_create(
+            state=locality.state, name=locality.name, postal_code=locality.postal_code
+        )[0]
+    locality.save(force_insert=True)
+    return locality
+
+
+def build_address(
     faker,
     *,
     locality: Optional[Locality] = None,
     **overrides,
 ) -> Address:
-    """Return an Address with normalized component data."""
+    """Return an unsaved Address with normalized component data.
 
-    locality = locality or create_locality(faker)
-    street_number = overrides.pop("street_number", str(faker.building_number()))
-    street_name = overrides.pop("street_name", faker.street_name())
-    street_type = overrides.pop("street_type", faker.street_suffix())
-    street_direction = overrides.pop("street_direction", "")
-    unit_type = overrides.pop("unit_type", "Suite")
-    unit_number = overrides.pop("unit_number", faker.random_element(["100", "200", "300"]))
-
-    formatted = (
-        f"{street_number} {street_name} {street_type}".strip()
-        + (f" {street_direction}" if street_direction else "")
-    ).strip()
-    raw = (
-        f"{formatted}, {locality.name}, {locality.state.code} {locality.postal_code}"
-        if locality
-        else formatted
-    )
+    The data mirrors what ``Address.save`` would store, so instances can be
+    passed straight to ``bulk_create``.
+    """
 
+    locality = locality or create_locality(faker)
     data: dict[str, Any] = {
-        "street_number": street_number,
-        "street_name": street_name,
-        "street_type": street_type,
-        "street_direction": street_direction,
-        "unit_type": unit_type,
-        "unit_number": unit_number,
+        "street_number": str(faker.building_number()),
+        "street_name": faker.street_name(),
+        "street_type": faker.street_suffix(),
+        "street_direction": "",
+        "unit_type": "Suite",
+        "unit_number": faker.random_element(["100", "200", "300"]),
         "locality": locality,
-        "raw": overrides.pop("raw", raw),
-        "formatted": overrides.pop("formatted", raw),
-        "latitude": overrides.pop("latitude", faker.latitude()),
-        "longitude": overrides.pop("longitude", faker.longitude()),
+        "latitude": faker.latitude(),
+        "longitude": faker.longitude(),
     }
     data.update(overrides)
-    return Address.objects.create(**data)
+    data.setdefault("route", data["street_name"])
+
+    if "raw" not in data or "formatted" not in data:
+        raw = _compose_raw(data, locality)
+        data.setdefault("raw", raw)
+        data.setdefault("formatted", raw)
+
+    address = Address(**data)
+    address.normalize()
+    return address
+
+
+def _compose_raw(data: dict[str, Any], locality: Locality) -> str:
+    """Return a one-line address string for the given component data."""
+
+    street = " ".join(
+        part
+        for part in (
+            data["street_number"],
+            data["street_name"],
+            data["street_type"],
+            data["street_direction"],
+        )
+        if part
+    )
+    state = locality.state
+    return f"{street}, {locality.name}, {state.code} {locality.postal_code}"
+
+
+def create_address(
+    faker,
+    *,
+    locality: Optional[Locality] = None,
+    **overrides,
+) -> Address:
+    """Return an Address with normalized component data."""
+
+    address = build_address(faker, locality=locality, **overrides)
+    address.save(force_insert=True)
+    return address
+
+
+def bulk_create_addresses(
+    faker,
+    count: int,
+    *,
+    locality: Locality,
+    batch_size: Optional[int] = None,
+    **overrides,
+) -> list[Address]:
+    """Insert ``count`` addresses for ``locality`` using batched INSERTs.
+
+    ``batch_size`` defaults to the ``ADDRESS_KIT_BULK_BATCH_SIZE`` environment
+    variable (100 when unset).
+    """
+
+    addresses = [build_address(faker, locality=locality, **overrides) for _ in range(count)]
+    return Address.objects.bulk_create(addresses, batch_size=batch_size or DEFAULT_BULK_BATCH_SIZE)
@@ -2,6 +2,11 @@
 Django test settings for django-address-kit.
 """
 
+import os
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
 SECRET_KEY = "test-secret-key-for-testing-only"
 
 INSTALLED_APPS = [
@@ -21,9 +26,28 @@ DATABASES = {
         "OPTIONS": {
             "timeout": 20,
         },
+        # File-backed so pytest-django can keep it between runs (--reuse-db).
+        "TEST": {"NAME": str(BASE_DIR / ".pytest-db.sqlite3")},
     }
 }
 
+if os.environ.get("PYTEST_FAST") == "1":
+    # In-memory profile: no disk I/O at all, rebuilt on every run.
+    DATABASES["default"]["TEST"] = {"NAME": ":memory:"}
+
+# Contrib apps and the legacy stub get their tables straight from the models;
+# replaying their migration history adds nothing to these tests. The
+# django_address_kit migrations keep running so they stay under test.
+MIGRATION_MODULES = {
+    "admin": None,
+    "auth": None,
+    "contenttypes": None,
+    "address": None,
+}
+
+# Fast hashing: PBKDF2 is deliberately slow and tests never need real passwords.
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 # Minimum required Django settings for test environment
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 USE_TZ = True
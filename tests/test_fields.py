@@ -1,19 +1,106 @@
+from contextlib import nullcontext
+
+import pytest
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.migrations.writer import MigrationWriter
 
 from django_address_kit.fields import AddressField
 from django_address_kit.models import Address
 
 
-def test_address_field_defaults_to_cascade():
-    field = AddressField()
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, {"null": False, "blank": False}),
+        ({"blank": True, "null": True}, {"null": True, "blank": True}),
+    ],
+    ids=["default", "nullable"],
+)
+def test_address_field_instantiation(kwargs, expected):
+    field = AddressField(**kwargs)
 
     assert isinstance(field, models.ForeignKey)
     assert field.remote_field.model is Address
     assert field.remote_field.on_delete is models.PROTECT
+    assert {attr: getattr(field, attr) for attr in expected} == expected
 
 
-def test_address_field_set_null_when_nullable():
-    field = AddressField(blank=True, null=True)
+@pytest.mark.parametrize(
+    "check",
+    [
+        lambda field: field.get_lookup("exact") is not None,
+        lambda field: field.get_lookup("isnull") is not None,
+        lambda field: field.related_model is Address,
+        lambda field: field.many_to_one is True,
+    ],
+    ids=["exact-lookup", "isnull-lookup", "related-model", "many-to-one"],
+)
+def test_address_field_relation_introspection(check):
+    assert check(AddressField())
 
-    assert field.null is True
-    assert field.remote_field.on_delete is models.PROTECT
+
+# Built once at import time and shared by the deconstruct/serialize tests.
+_DECONSTRUCT_CASES = [
+    pytest.param(AddressField(), {"on_delete": models.PROTECT}, id="default"),
+    pytest.param(AddressField(blank=True, null=True), {"blank": True, "null": True}, id="nullable"),
+    pytest.param(
+        AddressField(related_name="custom_addresses"),
+        {"related_name": "custom_addresses"},
+        id="related-name",
+    ),
+    pytest.param(
+        AddressField(on_delete=models.SET_NULL, null=True),
+        {"on_delete": models.SET_NULL, "null": True},
+        id="set-null",
+    ),
+]
+
+
+@pytest.mark.parametrize("field, expected", _DECONSTRUCT_CASES)
+def test_address_field_deconstruct(field, expected):
+    _, path, args, kwargs = field.deconstruct()
+
+    assert path == "django_address_kit.fields.AddressField"
+    assert args == []
+    assert kwargs["to"] == "django_address_kit.address"
+    assert {key: kwargs.get(key) for key in expected} == expected
+
+
+@pytest.mark.parametrize("field, expected", _DECONSTRUCT_CASES)
+def test_address_field_serializable_for_migrations(field, expected):
+    serialized, imports = MigrationWriter.serialize(field)
+
+    assert serialized.startswith("django_address_kit.fields.AddressField(")
+    assert "import django_address_kit.fields" in imports
+    for key, value in expected.items():
+        assert f"{key}={MigrationWriter.serialize(value)[0]}" in serialized
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "blank, null, use_address, raises",
+    [
+        (True, True, False, False),
+        (False, False, False, True),
+        (True, True, True, False),
+        (False, False, True, False),
+    ],
+    ids=["optional-none", "required-none", "optional-address", "required-address"],
+)
+def test_address_field_clean_matrix(blank, null, use_address, raises, address_instance):
+    field = AddressField(blank=blank, null=null)
+    value = address_instance.pk if use_address else None
+    context = pytest.raises(ValidationError) if raises else nullcontext()
+
+    with context:
+        assert field.clean(value, None) == value
+
+
+@pytest.mark.parametrize(
+    "blank, null, required",
+    [(True, True, False), (False, False, True)],
+    ids=["optional", "required"],
+)
+def test_address_field_formfield_required(blank, null, required):
+    assert AddressField(blank=blank, null=null).formfield().required is required
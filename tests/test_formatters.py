@@ -41,49 +41,56 @@ def test_format_us_address(components, expected_format):
     assert format_us_address(components) == expected_format
 
 
-def test_format_multiline_address():
-    """Test multiline address formatting."""
-    address_components = {
-        "street_number": "789",
-        "street_name": "Maple",
-        "street_type": "Road",
-        "city": "Elsewhere",
-        "state": "TX",
-        "zipcode": "67890",
-    }
+_FULL_COMPONENTS = {
+    "street_number": "100",
+    "street_name": "Tech",
+    "street_type": "Circle",
+    "unit_type": "Suite",
+    "unit_number": "500",
+    "city": "Silicon Valley",
+    "state": "CA",
+    "zipcode": "94000",
+}
 
-    expected_multiline = ["789 Maple Road", "Elsewhere, TX 67890"]
 
-    assert format_multiline_address(address_components) == expected_multiline
-
-
-def test_format_short_address():
-    """Test short address formatting."""
-    address_components = {"street_name": "Broadway", "city": "New York", "state": "NY"}
-
-    expected_short = "Broadway, New York, NY"
-    assert format_short_address(address_components) == expected_short
-
-
-def test_get_address_display_string():
-    """Test comprehensive address display string generation."""
-    full_components = {
-        "street_number": "100",
-        "street_name": "Tech",
-        "street_type": "Circle",
-        "unit_type": "Suite",
-        "unit_number": "500",
-        "city": "Silicon Valley",
-        "state": "CA",
-        "zipcode": "94000",
-    }
-
-    default_display = get_address_display_string(full_components)
-    assert default_display == "100 Tech Circle, Suite 500, Silicon Valley, CA 94000"
+@pytest.mark.parametrize(
+    "formatter, components, expected",
+    [
+        (
+            format_multiline_address,
+            {
+                "street_number": "789",
+                "street_name": "Maple",
+                "street_type": "Road",
+                "city": "Elsewhere",
+                "state": "TX",
+                "zipcode": "67890",
+            },
+            ["789 Maple Road", "Elsewhere, TX 67890"],
+        ),
+        (
+            format_short_address,
+            {"street_name": "Broadway", "city": "New York", "state": "NY"},
+            "Broadway, New York, NY",
+        ),
+    ],
+    ids=["multiline", "short"],
+)
+def test_formatter_output(formatter, components, expected):
+    """Test multiline and short address formatting."""
+    assert formatter(components) == expected
 
-    # Test with specific display options
-    compact_display = get_address_display_string(full_components, style="compact")
-    assert compact_display == "100 Tech Cir., Suite 500, Silicon Valley, CA 94000"
 
-    short_display = get_address_display_string(full_components, style="short")
-    assert short_display == "Tech Circle, Silicon Valley, CA"
+@pytest.mark.parametrize(
+    "style, expected",
+    [
+        (None, "100 Tech Circle, Suite 500, Silicon Valley, CA 94000"),
+        ("compact", "100 Tech Cir., Suite 500, Silicon Valley, CA 94000"),
+        ("short", "Tech Circle, Silicon Valley, CA"),
+    ],
+    ids=["default", "compact", "short"],
+)
+def test_get_address_display_string(style, expected):
+    """Test address display string generation for each style."""
+    kwargs = {"style": style} if style else {}
+    assert get_address_display_string(_FULL_COMPONENTS, **kwargs) == expected
@@ -1,16 +1,19 @@
+import io
 import json
 import os
 
 import pytest
 from address.models import Address as LegacyAddress
 from django.core.management import call_command
+from django.core.management.base import CommandError
 
-from django_address_kit.ingest import ingest_legacy_address
+from django_address_kit.ingest import ingest_legacy_address, ingest_legacy_addresses
 from django_address_kit.models import Address, AddressIdentifier, AddressSource
+from django_address_kit.providers import GeocodeError
 
 
 @pytest.mark.django_db
-def test_ingest_legacy_address_with_structured_fields(faker):
+def test_ingest_legacy_address_with_structured_fields():
     payload = {
         "line1": "1600 Amphitheatre Pkwy",
         "city": "Mountain View",
@@ -27,6 +30,90 @@ def test_ingest_legacy_address_with_structured_fields(faker):
     assert source.raw_payload["line1"] == "1600 Amphitheatre Pkwy"
 
 
+@pytest.mark.django_db
+def test_ingest_legacy_addresses_bulk_matches_single_ingest():
+    existing = ingest_legacy_address(
+        {
+            "line1": "742 Evergreen Terrace",
+            "city": "Springfield",
+            "state": "IL",
+            "postal_code": "62704",
+            "country": "United States",
+        },
+        geocode_missing=False,
+    )
+    payloads = [
+        {
+            "line1": "1600 Amphitheatre Pkwy",
+            "city": "Mountain View",
+            "state": "CA",
+            "postal_code": "94043",
+            "country": "United States",
+        },
+        {
+            "line1": "742 Evergreen Terrace",
+            "city": "Springfield",
+            "state": "IL",
+            "postal_code": "62704",
+            "country": "United States",
+        },
+        {
+            "line1": "1600 Amphitheatre Pkwy",
+            "city": "Mountain View",
+            "state": "CA",
+            "postal_code": "94043",
+            "country": "United States",
+        },
+        {
+            "line1": "1 Infinite Loop",
+            "unit": "4",
+            "city": "Cupertino",
+            "state": "CA",
+            "postal_code": "95014",
+            "country": "United States",
+        },
+    ]
+
+    first, repeat, duplicate, loop = ingest_legacy_addresses(
+        payloads, chunk_size=3, geocode_missing=False
+    )
+
+    assert repeat.pk == existing.pk
+    assert duplicate.pk == first.pk
+    assert first.street_number == "1600"
+    assert first.street_name == first.route == "Amphitheatre Pkwy"
+    assert first.locality.name == "Mountain View"
+    assert loop.unit_number == "4"
+    assert list(first.sources.values_list("version", flat=True)) == [2, 1]
+    assert list(existing.sources.values_list("version", flat=True)) == [2, 1]
+    assert loop.sources.get().normalized_components["location"]["locality_name"] == "Cupertino"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("count", [5, 50])
+def test_ingest_legacy_addresses_query_count_is_constant(
+    count, locality_instance, django_assert_max_num_queries
+):
+    payloads = [
+        {
+            "line1": f"{number} Market St",
+            "city": locality_instance.name,
+            "state": "California",
+            "state_code": "CA",
+            "postal_code": locality_instance.postal_code,
+            "country": "United States",
+            "country_code": "US",
+        }
+        for number in range(1, count + 1)
+    ]
+
+    # Savepoints, one location walk, the existing-row lookup and one INSERT per table.
+    with django_assert_max_num_queries(11):
+        addresses = ingest_legacy_addresses(payloads, geocode_missing=False)
+
+    assert {address.locality_id for address in addresses} == {locality_instance.pk}
+
+
 class DummyAdapter:
     provider_name = "google"
 
@@ -38,7 +125,7 @@ class DummyAdapter:
 
 
 @pytest.mark.django_db
-def test_ingest_legacy_address_triggers_geocode(faker):
+def test_ingest_legacy_address_triggers_geocode():
     payload = {
         "line1": "1600 Amphitheatre Pkwy",
         "city": "",
@@ -126,6 +213,7 @@ class RecordingAdapter:
 @pytest.mark.django_db
 def test_ingest_legacy_address_geocodes_raw_payloads():
     adapter = RecordingAdapter()
+    existing_ids = list(Address.objects.values_list("pk", flat=True))
     first_raw = "1600 Amphitheatre Pkwy, Mountain View, CA 94043"
     second_raw = "One Apple Park Way, Cupertino, CA 95014"
 
@@ -142,22 +230,76 @@ def test_ingest_legacy_address_geocodes_raw_payloads():
         geocode_adapter=adapter,
     )
 
-    assert Address.objects.count() == 2
+    assert Address.objects.exclude(pk__in=existing_ids).count() == 2
     assert duplicate.id == first.id
 
     formatted_values = {
         "1600 Amphitheatre Parkway, Mountain View, CA 94043, USA",
         "One Apple Park Way, Cupertino, CA 95014, USA",
     }
-    addresses = list(Address.objects.all())
-    assert {address.formatted for address in addresses} == formatted_values
-    assert {address.raw for address in addresses} == formatted_values
+    rows = list(Address.objects.exclude(pk__in=existing_ids).values_list("formatted", "raw"))
+    assert {formatted for formatted, _ in rows} == formatted_values
+    assert {raw for _, raw in rows} == formatted_values
     assert len(adapter.queries) == 3
     assert "Amphitheatre Parkway" in adapter.queries[0]
     assert "Apple Park Way" in adapter.queries[1]
     assert AddressIdentifier.objects.filter(provider="google").count() == 2
 
 
+@pytest.mark.django_db
+def test_ingest_legacy_addresses_skips_geocode_for_rows_cached_in_earlier_chunks():
+    adapter = RecordingAdapter()
+    raw = "1600 Amphitheatre Pkwy, Mountain View, CA 94043"
+
+    addresses = ingest_legacy_addresses(
+        [{"raw": raw, "country": "United States"}] * 4,
+        chunk_size=1,
+        geocode_adapter=adapter,
+    )
+
+    assert len({address.id for address in addresses}) == 1
+    assert len(adapter.queries) == 1
+
+
+@pytest.mark.django_db
+def test_ingest_legacy_address_cache_skips_repeat_geocode():
+    adapter = RecordingAdapter()
+    address_cache: dict = {}
+    payload = {"raw": "1600 Amphitheatre Pkwy, Mountain View, CA 94043", "country": "United States"}
+
+    first = ingest_legacy_address(payload, geocode_adapter=adapter, address_cache=address_cache)
+    repeat = ingest_legacy_address(
+        {**payload, "raw": payload["raw"].upper()},
+        geocode_adapter=adapter,
+        address_cache=address_cache,
+    )
+
+    assert repeat is first
+    assert len(adapter.queries) == 1
+
+
+@pytest.mark.django_db
+def test_ingest_legacy_addresses_prefetches_geocodes():
+    adapter = RecordingAdapter()
+    first_raw = "1600 Amphitheatre Pkwy, Mountain View, CA 94043"
+    second_raw = "One Apple Park Way, Cupertino, CA 95014"
+
+    first, second, duplicate = ingest_legacy_addresses(
+        [
+            {"raw": first_raw, "country": "United States"},
+            {"raw": second_raw, "country": "United States"},
+            {"raw": first_raw, "country": "United States"},
+        ],
+        geocode_adapter=adapter,
+    )
+
+    assert duplicate.id == first.id
+    assert second.locality.name == "Cupertino"
+    # The repeated raw string is geocoded once, ahead of the per-row writes.
+    assert len(adapter.queries) == 2
+    assert AddressIdentifier.objects.filter(provider="google").count() == 2
+
+
 @pytest.mark.django_db
 def test_management_command_ingests(tmp_path, monkeypatch):
     payload = [
@@ -174,36 +316,35 @@ def test_management_command_ingests(tmp_path, monkeypatch):
         },
     ]
     data_file = tmp_path / "addresses.jsonl"
-    with data_file.open("w", encoding="utf-8") as handle:
-        for entry in payload:
-            handle.write(json.dumps(entry) + "\n")
-
-        class DummyAdapter:
-            provider_name = "google"
-
-            def __init__(self, api_key):
-                self.api_key = api_key
-
-            def geocode(self, query):
-                return {
-                    "formatted": "1600 Amphitheatre Pkwy, Mountain View, CA 94043",
-                    "street_number": "1600",
-                    "street_name": "Amphitheatre",
-                    "route": "Amphitheatre Pkwy",
-                    "location": {
-                        "locality": "Mountain View",
-                        "state": "California",
-                        "state_code": "CA",
-                        "postal_code": "94043",
-                        "country": "United States",
-                        "country_code": "US",
-                    },
-                    "provider": "google",
-                    "raw_payload": {"place_id": "GOOGLE123"},
-                    "metadata": {"place_id": "GOOGLE123"},
-                }
+    data_file.write_text("".join(json.dumps(entry) + "\n" for entry in payload), encoding="utf-8")
+
+    class DummyAdapter:
+        provider_name = "google"
+
+        def __init__(self, api_key):
+            self.api_key = api_key
+
+        def geocode(self, query):
+            return {
+                "formatted": "1600 Amphitheatre Pkwy, Mountain View, CA 94043",
+                "street_number": "1600",
+                "street_name": "Amphitheatre",
+                "route": "Amphitheatre Pkwy",
+                "location": {
+                    "locality": "Mountain View",
+                    "state": "California",
+                    "state_code": "CA",
+                    "postal_code": "94043",
+                    "country": "United States",
+                    "country_code": "US",
+                },
+                "provider": "google",
+                "raw_payload": {"place_id": "GOOGLE123"},
+                "metadata": {"place_id": "GOOGLE123"},
+            }
 
     monkeypatch.setattr("django_address_kit.ingest.GoogleMapsAdapter", DummyAdapter)
+    existing_ids = list(Address.objects.values_list("pk", flat=True))
 
     call_command(
         "ingest_legacy_addresses",
@@ -214,13 +355,105 @@ def test_management_command_ingests(tmp_path, monkeypatch):
         "dummy",
     )
 
-    from django_address_kit.models import Address
-
-    assert Address.objects.count() == 2
+    assert Address.objects.exclude(pk__in=existing_ids).count() == 2
     identifiers = AddressIdentifier.objects.filter(provider="google")
     assert identifiers.exists()
 
 
+@pytest.mark.django_db
+def test_management_command_replays_failed_chunk_without_regeocoding(tmp_path, monkeypatch):
+    data_file = tmp_path / "addresses.jsonl"
+    payload = [{"line1": "1600 Amphitheatre Pkwy", "country": "United States"}, {"raw": ""}]
+    data_file.write_text("".join(json.dumps(entry) + "\n" for entry in payload), encoding="utf-8")
+
+    recorder = RecordingAdapter()
+    monkeypatch.setattr("django_address_kit.ingest.GoogleMapsAdapter", lambda api_key: recorder)
+    existing_ids = list(Address.objects.values_list("pk", flat=True))
+
+    with pytest.raises(CommandError, match="1 record"):
+        call_command(
+            "ingest_legacy_addresses",
+            "--input",
+            str(data_file),
+            "--geocode-missing",
+            "--google-api-key",
+            "dummy",
+        )
+
+    # The chunk failed on the empty record and was replayed row by row, reusing the
+    # prefetched geocode result instead of calling the provider again.
+    assert Address.objects.exclude(pk__in=existing_ids).count() == 1
+    assert [query for query in recorder.queries if query] == [
+        "1600 Amphitheatre Parkway, United States"
+    ]
+
+
+@pytest.mark.django_db
+def test_management_command_sends_failing_geocode_once(tmp_path, monkeypatch):
+    data_file = tmp_path / "addresses.jsonl"
+    payload = [{"line1": "1 Nowhere Rd", "country": "United States"}, {"raw": ""}]
+    data_file.write_text("".join(json.dumps(entry) + "\n" for entry in payload), encoding="utf-8")
+
+    class FailingAdapter:
+        provider_name = "google"
+        calls = 0
+
+        def __init__(self, api_key):
+            pass
+
+        def geocode(self, query):
+            FailingAdapter.calls += 1
+            raise GeocodeError("ZERO_RESULTS")
+
+    monkeypatch.setattr("django_address_kit.ingest.GoogleMapsAdapter", FailingAdapter)
+
+    # The chunk fails on the empty record and is replayed; the prefetch's failure is
+    # re-raised from the shared results instead of querying the provider again.
+    with pytest.raises(CommandError):
+        call_command(
+            "ingest_legacy_addresses",
+            "--input",
+            str(data_file),
+            "--geocode-missing",
+            "--google-api-key",
+            "dummy",
+        )
+
+    assert FailingAdapter.calls == 1
+
+
+@pytest.mark.django_db
+def test_management_command_reports_non_object_records(tmp_path):
+    data_file = tmp_path / "addresses.jsonl"
+    good = {
+        "line1": "123 Main St",
+        "city": "Boston",
+        "state": "MA",
+        "postal_code": "02129",
+        "country": "United States",
+    }
+    data_file.write_text(f'{json.dumps(good)}\n"oops"\n', encoding="utf-8")
+    existing_ids = list(Address.objects.values_list("pk", flat=True))
+    stderr = io.StringIO()
+
+    with pytest.raises(CommandError, match="1 record"):
+        call_command("ingest_legacy_addresses", "--input", str(data_file), stderr=stderr)
+
+    assert Address.objects.exclude(pk__in=existing_ids).count() == 1
+    assert 'Failed record: "oops"' in stderr.getvalue()
+
+
+@pytest.mark.parametrize("chunk_size", ["0", "-1"])
+def test_management_command_rejects_non_positive_chunk_size(tmp_path, chunk_size):
+    data_file = tmp_path / "addresses.jsonl"
+    data_file.write_text("{}\n", encoding="utf-8")
+
+    with pytest.raises(CommandError, match="--chunk-size"):
+        call_command(
+            "ingest_legacy_addresses", "--input", str(data_file), "--chunk-size", chunk_size
+        )
+
+
 @pytest.mark.django_db
 def test_ingest_from_legacy_model(tmp_path, settings):
     legacy = LegacyAddress.objects.create(
@@ -266,6 +499,7 @@ def test_dump_legacy_addresses_command(tmp_path):
     assert len(lines) == LegacyAddress.objects.count()
 
 
+@pytest.mark.serial
 @pytest.mark.django_db
 def test_ingest_with_live_google_geocode(tmp_path, settings):
     api_key = os.environ.get("GOOGLE_MAPS_API_KEY")
@@ -279,9 +513,8 @@ def test_ingest_with_live_google_geocode(tmp_path, settings):
     ]
 
     input_file = tmp_path / "google.jsonl"
-    with input_file.open("w", encoding="utf-8") as handle:
-        for entry in payloads:
-            handle.write(json.dumps(entry) + "\n")
+    input_file.write_text("".join(json.dumps(entry) + "\n" for entry in payloads), encoding="utf-8")
+    existing_ids = list(Address.objects.values_list("pk", flat=True))
 
     call_command(
         "ingest_legacy_addresses",
@@ -292,6 +525,6 @@ def test_ingest_with_live_google_geocode(tmp_path, settings):
         api_key,
     )
 
-    count = Address.objects.count()
+    count = Address.objects.exclude(pk__in=existing_ids).count()
     assert count >= 2
     assert AddressIdentifier.objects.filter(provider="google").count() == count
@@ -5,30 +5,45 @@ from tests import factories
 
 
 @pytest.mark.django_db
-def test_select_related_minimizes_queries(django_assert_num_queries, faker):
-    country = factories.create_country(faker, code="US", name="United States")
-    state = factories.create_state(faker, country=country, name="California", code="CA")
-    locality = factories.create_locality(
-        faker, state=state, name="San Francisco", postal_code="94102"
+def test_select_related_minimizes_queries(django_assert_num_queries, faker, locality_instance):
+    created = factories.bulk_create_addresses(
+        faker, 2, locality=locality_instance, street_type="Street"
     )
-    factories.create_address(
-        faker,
-        locality=locality,
-        street_number="100",
-        street_name="First",
-        street_type="Street",
-    )
-    factories.create_address(
-        faker,
-        locality=locality,
-        street_number="200",
-        street_name="Second",
-        street_type="Street",
+
+    # One joined query for the geography plus one per prefetched relation.
+    with django_assert_num_queries(3):
+        addresses = list(
+            models.Address.objects.with_geography()
+            .filter(pk__in=[address.pk for address in created])
+            .order_by("id")
+        )
+
+    with django_assert_num_queries(0):
+        assert [address.locality.state.country.code for address in addresses] == ["US", "US"]
+        assert [list(address.sources.all()) for address in addresses] == [[], []]
+
+
+@pytest.mark.django_db
+def test_bulk_created_addresses_match_save_normalization(faker, locality_instance):
+    created = factories.bulk_create_addresses(
+        faker, 2, locality=locality_instance, street_name="PO Box 12", route=""
     )
 
+    stored = models.Address.objects.filter(pk__in=[address.pk for address in created])
+    assert {(address.street_name, address.route, address.is_po_box) for address in stored} == {
+        ("PO Box 12", "PO Box 12", True)
+    }
+
+
+@pytest.mark.django_db
+def test_lean_queryset_prunes_columns(django_assert_num_queries, faker, locality_instance):
+    created = factories.bulk_create_addresses(faker, 2, locality=locality_instance)
+
     with django_assert_num_queries(1):
         addresses = list(
-            models.Address.objects.select_related("locality__state__country").order_by("id")
+            models.Address.objects.lean().filter(pk__in=[address.pk for address in created])
         )
+        assert {address.locality.state.country.code for address in addresses} == {"US"}
 
-    assert len(addresses) == 2
+    with django_assert_num_queries(1):
+        assert addresses[0].raw
@@ -1,26 +1,33 @@
 import pytest
 from django.core.exceptions import ValidationError
 from django_address_kit.models import Address, AddressSource, State
+from django_address_kit.resolvers import _record_address_source
 
 
 @pytest.mark.django_db
 def test_state_code_normalized(country_instance, faker):
-    state = State(name=faker.state(), code="ca", country=country_instance)
+    state = State(name=faker.state(), code="ny", country=country_instance)
     state.save()
 
-    assert state.code == "CA"
+    assert state.code == "NY"
 
 
-@pytest.mark.django_db
-def test_state_requires_name_and_code(country_instance):
-    state = State(name="", code="", country=country_instance)
+@pytest.mark.parametrize(
+    "name, code, missing",
+    [("", "CA", "name"), ("California", "", "code"), ("  ", "  ", "code")],
+    ids=["blank-name", "blank-code", "whitespace"],
+)
+def test_state_requires_name_and_code(name, code, missing):
+    state = State(name=name, code=code)
 
-    with pytest.raises(ValidationError):
-        state.save()
+    with pytest.raises(ValidationError) as excinfo:
+        state.clean()
+
+    assert missing in excinfo.value.message_dict
 
 
 @pytest.mark.django_db
-def test_state_code_unique_per_country(country_instance, faker):
+def test_state_code_unique_per_country(country_instance):
     State.objects.create(name="Alpha", code="AL", country=country_instance)
 
     second = State(name="Beta", code="AL", country=country_instance)
@@ -30,7 +37,7 @@ def test_state_code_unique_per_country(country_instance, faker):
 
 
 @pytest.mark.django_db
-def test_address_syncs_route_and_direction(locality_instance, faker):
+def test_address_syncs_route_and_direction(locality_instance):
     address = Address(
         street_number="500",
         street_name="Mission",
@@ -118,28 +125,13 @@ def test_address_source_str(address_instance):
 
 @pytest.mark.django_db
 def test_address_source_prunes_to_three(address_instance):
-    from django_address_kit.resolvers import create_address_from_components
-
-    location_data = {
-        "locality": address_instance.locality.name,
-        "postal_code": address_instance.locality.postal_code,
-        "state": address_instance.locality.state.name,
-        "state_code": address_instance.locality.state.code,
-        "country": address_instance.locality.state.country.name,
-        "country_code": address_instance.locality.state.country.code,
-    }
-
     for idx in range(5):
-        create_address_from_components(
-            address_data={
-                "street_number": address_instance.street_number,
-                "street_name": address_instance.street_name,
-                "provider": "google",
-                "raw_payload": {"idx": idx},
-                "metadata": {"seq": idx},
-            },
-            location_data=location_data,
-            raw=address_instance.raw,
+        _record_address_source(
+            address=address_instance,
+            provider="google",
+            snapshot={},
+            raw_payload={"idx": idx},
+            metadata={"seq": idx},
         )
 
     sources = list(
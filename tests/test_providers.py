@@ -1,56 +1,89 @@
 import pytest
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connections
 
+from django_address_kit.providers.base import GeocodeError, RateLimitError, geocode_many
+from django_address_kit.providers.cache import CachedGeocodeAdapter
 from django_address_kit.providers.google import GoogleMapsAdapter
 from django_address_kit.providers.loqate import LoqateAdapter
 
+# Canned provider payloads; the adapters only read them, so they are shared.
+_GOOGLE_RESULT = {
+    "formatted_address": "1600 Amphitheatre Parkway, Mountain View, CA 94043, USA",
+    "geometry": {
+        "location": {"lat": 37.4224764, "lng": -122.0842499},
+        "location_type": "ROOFTOP",
+        "viewport": {
+            "northeast": {"lat": 37.42382538029149, "lng": -122.0829009197085},
+            "southwest": {"lat": 37.4211274197085, "lng": -122.0855988802915},
+        },
+    },
+    "place_id": "ChIJ2eUgeAK6j4ARbn5u_wAGqWA",
+    "types": ["street_address"],
+    "address_components": [
+        {"long_name": "1600", "short_name": "1600", "types": ["street_number"]},
+        {
+            "long_name": "Amphitheatre Parkway",
+            "short_name": "Amphitheatre Pkwy",
+            "types": ["route"],
+        },
+        {
+            "long_name": "Mountain View",
+            "short_name": "Mountain View",
+            "types": ["locality", "political"],
+        },
+        {
+            "long_name": "Santa Clara County",
+            "short_name": "Santa Clara County",
+            "types": ["administrative_area_level_2", "political"],
+        },
+        {
+            "long_name": "California",
+            "short_name": "CA",
+            "types": ["administrative_area_level_1", "political"],
+        },
+        {
+            "long_name": "United States",
+            "short_name": "US",
+            "types": ["country", "political"],
+        },
+        {"long_name": "94043", "short_name": "94043", "types": ["postal_code"]},
+    ],
+    "plus_code": {"compound_code": "CWC8+W5 Mountain View, California"},
+}
 
-class DummyGoogleClient:
-    def geocode(self, query: str):
-        return [
+_LOQATE_RESPONSE = [
+    {
+        "Input": {"Address": "123 Main St Boston MA 02129", "Country": "US"},
+        "Matches": [
             {
-                "formatted_address": "1600 Amphitheatre Parkway, Mountain View, CA 94043, USA",
-                "geometry": {
-                    "location": {"lat": 37.4224764, "lng": -122.0842499},
-                    "location_type": "ROOFTOP",
-                    "viewport": {
-                        "northeast": {"lat": 37.42382538029149, "lng": -122.0829009197085},
-                        "southwest": {"lat": 37.4211274197085, "lng": -122.0855988802915},
-                    },
-                },
-                "place_id": "ChIJ2eUgeAK6j4ARbn5u_wAGqWA",
-                "types": ["street_address"],
-                "address_components": [
-                    {"long_name": "1600", "short_name": "1600", "types": ["street_number"]},
-                    {
-                        "long_name": "Amphitheatre Parkway",
-                        "short_name": "Amphitheatre Pkwy",
-                        "types": ["route"],
-                    },
-                    {
-                        "long_name": "Mountain View",
-                        "short_name": "Mountain View",
-                        "types": ["locality", "political"],
-                    },
-                    {
-                        "long_name": "Santa Clara County",
-                        "short_name": "Santa Clara County",
-                        "types": ["administrative_area_level_2", "political"],
-                    },
-                    {
-                        "long_name": "California",
-                        "short_name": "CA",
-                        "types": ["administrative_area_level_1", "political"],
-                    },
-                    {
-                        "long_name": "United States",
-                        "short_name": "US",
-                        "types": ["country", "political"],
-                    },
-                    {"long_name": "94043", "short_name": "94043", "types": ["postal_code"]},
-                ],
-                "plus_code": {"compound_code": "CWC8+W5 Mountain View, California"},
+                "AQI": "A",
+                "AVC": "V44-I44-P7-100",
+                "Address": "123 Main St,Boston MA 02129-3533",
+                "AdministrativeArea": "MA",
+                "Country": "US",
+                "CountryName": "United States",
+                "DeliveryAddress": "123 Main St",
+                "DeliveryAddress1": "123 Main St",
+                "Locality": "Boston",
+                "MatchRuleLabel": "Rlhng",
+                "PostalCode": "02129-3533",
+                "PostalCodePrimary": "02129",
+                "PostalCodeSecondary": "3533",
+                "Premise": "123",
+                "PremiseNumber": "123",
+                "Sequence": "1",
+                "SubAdministrativeArea": "Suffolk",
+                "Thoroughfare": "Main St",
             }
-        ]
+        ],
+    }
+]
+
+
+class DummyGoogleClient:
+    def geocode(self, query: str):
+        return [_GOOGLE_RESULT]
 
 
 @pytest.mark.parametrize("query", ["1600 Amphitheatre Parkway, Mountain View, CA 94043"])
@@ -70,35 +103,7 @@ def test_google_adapter_maps_payload(query):
 
 
 def test_loqate_adapter_parses_verify_payload():
-    response = [
-        {
-            "Input": {"Address": "123 Main St Boston MA 02129", "Country": "US"},
-            "Matches": [
-                {
-                    "AQI": "A",
-                    "AVC": "V44-I44-P7-100",
-                    "Address": "123 Main St,Boston MA 02129-3533",
-                    "AdministrativeArea": "MA",
-                    "Country": "US",
-                    "CountryName": "United States",
-                    "DeliveryAddress": "123 Main St",
-                    "DeliveryAddress1": "123 Main St",
-                    "Locality": "Boston",
-                    "MatchRuleLabel": "Rlhng",
-                    "PostalCode": "02129-3533",
-                    "PostalCodePrimary": "02129",
-                    "PostalCodeSecondary": "3533",
-                    "Premise": "123",
-                    "PremiseNumber": "123",
-                    "Sequence": "1",
-                    "SubAdministrativeArea": "Suffolk",
-                    "Thoroughfare": "Main St",
-                }
-            ],
-        }
-    ]
-
-    adapter = LoqateAdapter(api_key="dummy", http_get=lambda endpoint, params: response)
+    adapter = LoqateAdapter(api_key="dummy", http_get=lambda endpoint, params: _LOQATE_RESPONSE)
     result = adapter.geocode("123 Main St Boston MA 02129")
 
     assert result["provider"] == "loqate"
@@ -107,3 +112,58 @@ def test_loqate_adapter_parses_verify_payload():
     assert result["location"]["locality"] == "Boston"
     assert result["metadata"]["aqi"] == "A"
     assert result["raw_payload"]["Matches"][0]["PostalCodePrimary"] == "02129"
+
+
+def test_cached_adapter_reuses_normalized_query():
+    class CountingClient(DummyGoogleClient):
+        calls = 0
+
+        def geocode(self, query: str):
+            CountingClient.calls += 1
+            return super().geocode(query)
+
+    adapter = CachedGeocodeAdapter(
+        GoogleMapsAdapter(client=CountingClient()), cache=LocMemCache("geocode-test", {})
+    )
+
+    first = adapter.geocode("1600 Amphitheatre Parkway, Mountain View, CA 94043")
+    second = adapter.geocode("  1600 amphitheatre parkway,  Mountain View, CA 94043 ")
+
+    assert CountingClient.calls == 1
+    assert second == first
+    assert adapter.provider_name == "google"
+
+
+@pytest.mark.django_db
+def test_geocode_many_closes_worker_database_connections():
+    opened = []
+
+    class DatabaseBackedAdapter:
+        provider_name = "db"
+
+        def geocode(self, query: str):
+            wrapper = connections["default"]
+            with wrapper.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            opened.append(wrapper)
+            return {"query": query}
+
+    results = geocode_many(DatabaseBackedAdapter(), ["a", "b", "c"], max_workers=3)
+
+    assert sorted(results) == ["a", "b", "c"]
+    assert opened and all(wrapper.connection is None for wrapper in opened)
+
+
+def test_geocode_many_keeps_permanent_failures_and_drops_rate_limits():
+    class FailingAdapter:
+        provider_name = "failing"
+
+        def geocode(self, query: str):
+            if query == "busy":
+                raise RateLimitError("OVER_QUERY_LIMIT")
+            raise GeocodeError("ZERO_RESULTS")
+
+    results = geocode_many(FailingAdapter(), ["busy", "nowhere"])
+
+    assert list(results) == ["nowhere"]
+    assert isinstance(results["nowhere"], GeocodeError)
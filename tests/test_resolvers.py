@@ -1,17 +1,19 @@
 import pytest
+from django.db import connection
 
+from django_address_kit.models import AddressSource
 from django_address_kit.providers.base import RateLimitError, RetryConfig
 from django_address_kit.resolvers import (
     create_address_from_components,
     create_address_from_raw,
+    create_addresses_from_components,
 )
-from tests import factories
 
 
 @pytest.mark.django_db
 def test_create_address_from_components_reuses_location(
     country_instance,
-    django_assert_num_queries,
+    django_assert_max_num_queries,
 ):
     address_data = {
         "street_number": "1600",
@@ -32,7 +34,7 @@ def test_create_address_from_components_reuses_location(
         "postal_code": "94043",
     }
 
-    with django_assert_num_queries(30, exact=False):
+    with django_assert_max_num_queries(15):
         address = create_address_from_components(
             address_data=address_data,
             location_data=location_data,
@@ -52,12 +54,10 @@ def test_create_address_from_components_reuses_location(
 
 
 @pytest.mark.django_db
-def test_create_address_from_raw_parser_fallback(faker, django_assert_num_queries):
-    country = factories.create_country(faker, code="US", name="United States")
-    factories.create_state(faker, country=country, name="California", code="CA")
+def test_create_address_from_raw_parser_fallback(state_instance, django_assert_max_num_queries):
     raw = "742 Evergreen Terrace, Springfield, CA 99999"
 
-    with django_assert_num_queries(20, exact=False):
+    with django_assert_max_num_queries(14):
         address = create_address_from_raw(raw)
 
     assert address.street_name == "Evergreen Terrace"
@@ -84,9 +84,9 @@ class _FlakyAdapter:
 
 
 @pytest.mark.django_db
-def test_create_address_from_raw_retries_on_rate_limit(faker, django_assert_num_queries):
-    country = factories.create_country(faker, code="US", name="United States")
-    factories.create_state(faker, country=country, name="California", code="CA")
+def test_create_address_from_raw_retries_on_rate_limit(
+    state_instance, django_assert_max_num_queries
+):
     payload = {
         "street_number": "123",
         "street_name": "Retry",
@@ -105,7 +105,7 @@ def test_create_address_from_raw_retries_on_rate_limit(faker, django_assert_num_
     }
     adapter = _FlakyAdapter(payload)
 
-    with django_assert_num_queries(25, exact=False):
+    with django_assert_max_num_queries(15):
         address = create_address_from_raw(
             "123 Retry Road, Retryville, CA 94110",
             geocode_adapter=adapter,
@@ -150,3 +150,28 @@ def test_resolver_stores_provider_identifier(locality_instance):
 
     identifier = address.identifiers.get(provider="google")
     assert identifier.identifier == "GOOGLE123"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("returns_rows", [True, False], ids=["returning", "no-returning"])
+def test_create_addresses_from_components_records_sources(monkeypatch, returns_rows):
+    monkeypatch.setattr(type(connection.features), "can_return_rows_from_bulk_insert", returns_rows)
+    location_data = {
+        "locality": "Mountain View",
+        "postal_code": "94043",
+        "state": "California",
+        "state_code": "CA",
+        "country": "United States",
+        "country_code": "US",
+    }
+    entry = (
+        {"street_number": "1600", "street_name": "Amphitheatre", "provider": "manual"},
+        location_data,
+        "1600 Amphitheatre Parkway, Mountain View, CA 94043",
+    )
+
+    first, repeat = create_addresses_from_components([entry, entry])
+
+    assert repeat.pk == first.pk
+    versions = AddressSource.objects.filter(address=first).values_list("version", flat=True)
+    assert sorted(versions) == [1, 2]
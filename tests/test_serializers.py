@@ -1,8 +1,15 @@
 import pytest
+from rest_framework import serializers
 
-from django_address_kit.models import AddressSource
+from django_address_kit.models import Address, AddressSource
 from django_address_kit.models import AddressIdentifier
-from django_address_kit.serializers import AddressSerializer
+from django_address_kit.resolvers import create_address_from_components
+from django_address_kit.serializers import (
+    AddressSerializer,
+    CountrySerializer,
+    LocalitySerializer,
+    StateSerializer,
+)
 
 
 @pytest.mark.django_db
@@ -76,3 +83,178 @@ def test_address_serializer_update_sets_locality(address_instance):
 
     response_data = AddressSerializer(updated).data
     assert "sources" in response_data
+
+
+@pytest.mark.django_db
+def test_address_list_serializer_renders_queryset_from_values(
+    address_instance, django_assert_num_queries
+):
+    create_address_from_components(
+        address_data={
+            "street_number": "1600",
+            "street_name": "Amphitheatre",
+            "street_type": "Parkway",
+            "provider": "google",
+            "raw_payload": {"results": [{"place_id": "PLACE123"}]},
+        },
+        location_data={
+            "locality": "Mountain View",
+            "postal_code": "94043",
+            "state": "California",
+            "state_code": "CA",
+            "country": "United States",
+            "country_code": "US",
+        },
+        raw="1600 Amphitheatre Parkway, Mountain View, CA 94043",
+    )
+    Address.objects.create(raw="PO Box 42")
+
+    queryset = Address.objects.order_by("pk")
+    expected = [AddressSerializer(address).data for address in queryset]
+
+    with django_assert_num_queries(3):
+        data = AddressSerializer(queryset, many=True).data
+
+    assert data == expected
+    assert data[1]["identifiers"][0]["identifier"] == "PLACE123"
+    assert AddressSerializer(queryset[1:2], many=True).data == expected[1:2]
+    assert data[2]["locality"] is None
+
+
+class _SlimAddressSerializer(AddressSerializer):
+    class Meta(AddressSerializer.Meta):
+        fields = ["raw", "formatted", "locality"]
+        read_only_fields = []
+
+
+class _TaggedSourcesSerializer(AddressSerializer):
+    def get_sources(self, instance):
+        return ["tagged"]
+
+
+@pytest.mark.django_db
+def test_address_list_serializer_omits_unrequested_id_and_relations(
+    address_instance, django_assert_num_queries
+):
+    queryset = Address.objects.order_by("pk")
+    expected = [_SlimAddressSerializer(address).data for address in queryset]
+
+    with django_assert_num_queries(1):
+        data = _SlimAddressSerializer(queryset, many=True).data
+
+    assert data == expected
+    assert "id" not in data[0]
+
+
+@pytest.mark.django_db
+def test_address_list_serializer_respects_child_overrides(address_instance):
+    data = _TaggedSourcesSerializer(Address.objects.all(), many=True).data
+
+    assert data[0]["sources"] == ["tagged"]
+
+
+class _PkLocalitySerializer(AddressSerializer):
+    locality = serializers.PrimaryKeyRelatedField(read_only=True)
+
+
+class _RemappedFormattedSerializer(AddressSerializer):
+    formatted = serializers.CharField(source="raw", read_only=True)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("serializer_class", [_PkLocalitySerializer, _RemappedFormattedSerializer])
+def test_address_list_serializer_matches_redeclared_fields(address_instance, serializer_class):
+    address_instance.formatted = "Formatted differently"
+    address_instance.save()
+    queryset = Address.objects.order_by("pk")
+
+    data = serializer_class(queryset, many=True).data
+
+    assert data == [serializer_class(address).data for address in queryset]
+
+
+@pytest.mark.django_db
+def test_address_list_serializer_create_reuses_resolved_locality(country_instance):
+    locality = {
+        "name": "Mountain View",
+        "postal_code": "94041",
+        "state": {
+            "name": "California",
+            "code": "CA",
+            "country": {"name": country_instance.name, "code": country_instance.code},
+        },
+    }
+    payload = [
+        {
+            "raw": f"{number} Castro Street, Mountain View, CA 94041",
+            "street_number": str(number),
+            "street_name": "Castro",
+            "locality": locality,
+        }
+        for number in (100, 200, 300)
+    ]
+    context: dict = {}
+
+    serializer = AddressSerializer(data=payload, many=True, context=context)
+    assert serializer.is_valid(), serializer.errors
+    addresses = serializer.save()
+
+    assert len(addresses) == 3
+    assert len({address.locality_id for address in addresses}) == 1
+    assert len(context["locality_cache"]) == 1
+
+
+@pytest.mark.django_db
+def test_address_serializer_reuses_prefetched_relations(
+    address_instance, django_assert_num_queries
+):
+    for version in (1, 2):
+        AddressSource.objects.create(
+            address=address_instance, provider="google", version=version, normalized_components={}
+        )
+    for identifier in ("place-b", "place-a"):
+        AddressIdentifier.objects.create(
+            address=address_instance, provider="google", identifier=identifier
+        )
+    expected = AddressSerializer(address_instance).data
+    address = Address.objects.with_geography().get(pk=address_instance.pk)
+
+    with django_assert_num_queries(0):
+        data = AddressSerializer(address).data
+
+    assert data == expected
+    assert [source["version"] for source in data["sources"]] == [2, 1]
+
+
+@pytest.mark.parametrize(
+    "serializer_cls, data, error_field, error_code",
+    [
+        (
+            CountrySerializer,
+            {"name": "Test Country", "code": "U"},
+            "non_field_errors",
+            "country_code_length",
+        ),
+        (CountrySerializer, {"name": "Test Country", "code": "USA"}, "code", "max_length"),
+        (CountrySerializer, {"name": "A" * 300, "code": "US"}, "name", "max_length"),
+        (StateSerializer, {"name": "Test State", "code": "TOOLONGCODE"}, "code", "max_length"),
+        (
+            LocalitySerializer,
+            {"name": "Test City", "postal_code": "NODIGITS"},
+            "postal_code",
+            "postal_code_digits",
+        ),
+    ],
+    ids=[
+        "country-code-short",
+        "country-code-long",
+        "country-name-long",
+        "state-code",
+        "postal-code",
+    ],
+)
+def test_geography_serializer_validation(serializer_cls, data, error_field, error_code):
+    serializer = serializer_cls(data=data)
+
+    assert not serializer.is_valid()
+    assert serializer.errors[error_field][0].code == error_code
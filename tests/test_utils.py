@@ -1,3 +1,5 @@
+import pytest
+
 from django_address_kit.utils import normalize_string, parse_address_components, standardize_address
 
 
@@ -5,29 +7,58 @@ def test_normalize_string_trims_and_collapses_whitespace():
     assert normalize_string("  123   MAIN st ") == "123 MAIN st"
 
 
-def test_parse_address_components_breaks_into_fields():
-    components = parse_address_components("1600 Amphitheatre Pkwy, Mountain View, CA 94043")
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (
+            "1600 Amphitheatre Pkwy, Mountain View, CA 94043",
+            {
+                "street_number": "1600",
+                "street_name": "Amphitheatre",
+                "street_type": "PKWY",
+                "city": "Mountain View",
+                "state": "CA",
+                "zipcode": "94043",
+            },
+        ),
+        (
+            "PO Box 123, Apt 4B, 742 Evergreen Terrace, Springfield, IL 62704",
+            {
+                "po_box": "123",
+                "unit_type": "APT",
+                "unit_number": "4B",
+                "street_number": "742",
+                "street_name": "Evergreen Terrace",
+            },
+        ),
+    ],
+    ids=["street", "po-box-and-unit"],
+)
+def test_parse_address_components(raw, expected):
+    components = parse_address_components(raw)
+
+    assert {key: components.get(key) for key in expected} == expected
 
-    assert components["street_number"] == "1600"
-    assert components["street_name"] == "Amphitheatre"
-    assert components["street_type"] == "PKWY"
-    assert components["city"] == "Mountain View"
-    assert components["state"] == "CA"
-    assert components["zipcode"] == "94043"
 
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (
+            "1600 Amphitheatre Pkwy, Mountain View, CA 94043",
+            "1600 Amphitheatre Parkway, Mountain View, CA 94043",
+        ),
+        ("9 AVE ST RD", "9 Avenue Street Road"),
+        ("12 Elm ct, Stanford", "12 Elm Court, Stanford"),
+    ],
+)
+def test_standardize_address_expands_suffixes(raw, expected):
+    assert standardize_address(raw) == expected
 
-def test_parse_address_components_handles_po_box_and_units():
-    components = parse_address_components(
-        "PO Box 123, Apt 4B, 742 Evergreen Terrace, Springfield, IL 62704"
-    )
 
-    assert components["po_box"] == "123"
-    assert components["unit_type"] == "APT"
-    assert components["unit_number"] == "4B"
-    assert components["street_number"] == "742"
-    assert components["street_name"].startswith("Evergreen")
+def test_parse_address_components_returns_independent_copies():
+    raw = "1600 Amphitheatre Pkwy, Mountain View, CA 94043"
 
+    first = parse_address_components(raw)
+    first["provider"] = "parser"
 
-def test_standardize_address_expands_suffixes():
-    result = standardize_address("1600 Amphitheatre Pkwy, Mountain View, CA 94043")
-    assert "Parkway" in result
+    assert "provider" not in parse_address_components(raw)
@@ -0,0 +1,93 @@
+import pytest
+from django.core.exceptions import ValidationError
+
+from django_address_kit.validators import (
+    state_code_validator,
+    validate_po_box,
+    validate_state_code,
+    validate_state_codes,
+    validate_street_address,
+    validate_zip_code,
+    validate_zip_codes,
+    zip_code_validator,
+)
+
+
+class _Stringable:
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return self.value
+
+
+_CASES = [
+    (validate_state_code, "CA", True),
+    (validate_state_code, _Stringable("NY"), True),
+    (validate_state_code, " pr ", True),
+    (validate_state_code, "ZZ", False),
+    (validate_state_code, "CAL", False),
+    (validate_zip_code, "94043", True),
+    (validate_zip_code, 94043, True),
+    (validate_zip_code, ["94043"], False),
+    (validate_zip_code, "94043-1351", True),
+    (validate_zip_code, "9404", False),
+    (validate_zip_code, "94043-", False),
+    (validate_zip_code, "94043-1351" * 1000, False),
+    (validate_zip_code, "\uff19\uff14\uff10\uff14\uff13", False),
+    (validate_zip_code, "94043 1351", False),
+    (validate_street_address, "1600 Amphitheatre Pkwy", True),
+    (validate_street_address, "Main Street", False),
+    (validate_street_address, "12345", False),
+    (validate_street_address, "12 Main St; DROP TABLE", False),
+    (validate_street_address, "123 Cañon Dr", True),
+    (validate_street_address, "\uff11\uff12 Main St", False),
+    (validate_po_box, "P.O. Box 123", True),
+    (validate_po_box, "POB 789", True),
+    (validate_po_box, "Box 123", False),
+    (validate_po_box, "PO Box \uff11\uff12\uff13", False),
+    (state_code_validator, "CA", True),
+    (state_code_validator, "CA\n", False),
+    (zip_code_validator, "94043", True),
+    (zip_code_validator, "94043\n", False),
+    (zip_code_validator, "\uff19\uff14\uff10\uff14\uff13", False),
+]
+
+
+@pytest.mark.parametrize("validator, value, valid", _CASES)
+def test_validators(validator, value, valid):
+    if valid:
+        validator(value)
+    else:
+        with pytest.raises(ValidationError) as excinfo:
+            validator(value)
+        assert excinfo.value.code in {"invalid", "min_length"}
+
+
+@pytest.mark.parametrize(
+    "validator", [validate_state_code, validate_zip_code, validate_street_address, validate_po_box]
+)
+def test_validators_require_a_value(validator):
+    with pytest.raises(ValidationError) as excinfo:
+        validator("")
+
+    assert excinfo.value.code == "required"
+
+
+@pytest.mark.parametrize(
+    "batch_validator, single_validator",
+    [(validate_state_codes, validate_state_code), (validate_zip_codes, validate_zip_code)],
+)
+def test_batch_validators_match_single_value_validators(batch_validator, single_validator):
+    values = [value for validator, value, _ in _CASES if validator is single_validator] + [""]
+
+    expected = []
+    for value in values:
+        try:
+            single_validator(value)
+        except ValidationError:
+            expected.append(False)
+        else:
+            expected.append(True)
+
+    assert batch_validator(values) == expected